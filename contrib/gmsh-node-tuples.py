@@ -1,11 +1,15 @@
 import os
+import sys
 from collections.abc import Sequence
+from typing import Any, TextIO
 
 import gmsh
+import numpy as np
 
 
-OUTPUT_TEMPLATE = """# GENERATED by gmsh_interop/contrib/gmsh-node-tuples.py
+OUTPUT_HEADER = """# GENERATED by gmsh_interop/contrib/gmsh-node-tuples.py
 # GMSH_VERSION: %s
+# GENERATOR_HASH: %s
 # DO NOT EDIT
 
 from collections.abc import Sequence
@@ -19,15 +23,6 @@ class ElementInfo(TypedDict):
     '''An integer denoting the type of the element.'''
     node_tuples: Sequence[tuple[int, ...]]
     '''Index tuples that describe the ordering of the nodes.'''
-
-
-triangle_data: dict[int, ElementInfo] = %s
-
-tetrahedron_data: dict[int, ElementInfo] = %s
-
-quadrangle_data: dict[int, ElementInfo] = %s
-
-hexahedron_data: dict[int, ElementInfo] = %s
 """
 
 
@@ -98,22 +93,78 @@ def generate_node_tuples_from_gmsh(
     assert dim == eldim
     assert nvertices == elvertices
 
+    # affine map from the reference domain to [0, order]^dim
     if domain == "unit":
-        pass
+        scale, shift = order, 0.0
     elif domain == "biunit":
-        nodes = (1.0 + nodes) / 2.0
+        scale, shift = order / 2.0, order / 2.0
     else:
         raise ValueError(f"unknown domain: '{domain}'")
 
-    nodes = nodes.reshape(nnodes, dim) * order
+    # NOTE: the reference coordinates are only accurate up to round-off, so
+    # truncating them with astype(int) can produce duplicate node tuples
+    nodes = np.rint(nodes.reshape(nnodes, dim) * scale + shift)
 
     # }}}
 
-    return [tuple(int(x) for x in node) for node in nodes.astype(int)]
+    return list(map(tuple, nodes.astype(np.int64).tolist()))
+
+
+def get_generator_hash() -> str:
+    """Return a hash of this script, so that changes to how the node tuples
+    are generated also cause them to be regenerated.
+    """
+    import hashlib
+
+    with open(__file__, "rb") as fd:
+        return hashlib.sha256(fd.read()).hexdigest()[:16]
+
+
+def get_generated_header(filename: str) -> dict[str, str]:
+    header = {}
+    with open(filename) as fd:
+        for line in fd:
+            if not line.startswith("#"):
+                break
+
+            key, sep, value = line[1:].partition(":")
+            if sep:
+                header[key.strip()] = value.strip()
+
+    return header
+
+
+def format_element_data(data: dict[int, dict[str, Any]]) -> str:
+    lines = ["{"]
+    for order, info in sorted(data.items()):
+        lines.append(f"    {order}: {{")
+        lines.extend(
+            f'        "{key}": {value!r},' for key, value in sorted(info.items()))
+        lines.append("    },")
+    lines.append("}")
+
+    return "\n".join(lines)
+
+
+def write_node_tuples(fd: TextIO, variables: dict[str, dict[int, Any]]) -> None:
+    fd.write(OUTPUT_HEADER % (gmsh.GMSH_API_VERSION, get_generator_hash()))
+
+    for name, data in variables.items():
+        fd.write(f"\n\n{name}: dict[int, ElementInfo] = ")
+        fd.write(format_element_data(data))
+
+    fd.write("\n")
 
 
 def generate_node_tuples(filename: str | None, *, overwrite: bool = False) -> int:
     if not overwrite and filename is not None and os.path.exists(filename):
+        header = get_generated_header(filename)
+        if (header.get("GMSH_VERSION") == gmsh.GMSH_API_VERSION
+                and header.get("GENERATOR_HASH") == get_generator_hash()):
+            print(f"File is up to date for gmsh {gmsh.GMSH_API_VERSION}: "
+                  f"'{filename}'")
+            return 0
+
         print(f"ERROR: File already exists (use --force): '{filename}'")
         return 1
 
@@ -123,7 +174,8 @@ def generate_node_tuples(filename: str | None, *, overwrite: bool = False) -> in
     hex_data = {}
 
     gmsh.initialize()
-    gmsh.option.setNumber("General.Terminal", 1)
+    gmsh.option.setNumber(
+        "General.Terminal", int(os.environ.get("GMSH_VERBOSE", "0")))
 
     for order, (name, eltype) in enumerate(TRIANGLE_ELEMENTS.items()):
         node_tuples = generate_node_tuples_from_gmsh(eltype, 2, 3)
@@ -159,21 +211,18 @@ def generate_node_tuples(filename: str | None, *, overwrite: bool = False) -> in
 
     gmsh.finalize()
 
-    from pprint import pformat
-
-    txt = (OUTPUT_TEMPLATE % (
-        gmsh.GMSH_API_VERSION,
-        pformat(tri_data, width=80),
-        pformat(tet_data, width=80),
-        pformat(qua_data, width=80),
-        pformat(hex_data, width=80),
-        )).replace('"', "")
+    variables = {
+        "triangle_data": tri_data,
+        "tetrahedron_data": tet_data,
+        "quadrangle_data": qua_data,
+        "hexahedron_data": hex_data,
+        }
 
     if filename is None:
-        print(txt)
+        write_node_tuples(sys.stdout, variables)
     else:
         with open(filename, "w") as fd:
-            fd.write(txt)
+            write_node_tuples(fd, variables)
 
     return 0
 
@@ -1,11 +1,43 @@
+import os
+import time
 from importlib import metadata
+from urllib.error import URLError
 from urllib.request import urlopen
 
 
 _conf_url = \
         "https://raw.githubusercontent.com/inducer/sphinxconfig/main/sphinxconfig.py"
-with urlopen(_conf_url) as _inf:
-    exec(compile(_inf.read(), _conf_url, "exec"), globals())
+_conf_cache = os.path.join(
+        os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+        "gmsh_interop", "sphinxconfig.py")
+_conf_max_age = 24 * 60 * 60
+
+
+def _read_sphinxconfig() -> bytes:
+    have_cache = os.path.exists(_conf_cache)
+    if have_cache and time.time() - os.path.getmtime(_conf_cache) < _conf_max_age:
+        with open(_conf_cache, "rb") as inf:
+            return inf.read()
+
+    try:
+        with urlopen(_conf_url) as inf:
+            source = inf.read()
+    except URLError:
+        if not have_cache:
+            raise
+
+        # offline: fall back to the stale copy
+        with open(_conf_cache, "rb") as inf:
+            return inf.read()
+
+    os.makedirs(os.path.dirname(_conf_cache), exist_ok=True)
+    with open(_conf_cache, "wb") as outf:
+        outf.write(source)
+
+    return source
+
+
+exec(compile(_read_sphinxconfig(), _conf_url, "exec"), globals())
 
 author = "Andreas Klöckner"
 copyright = "2020-24, Andreas Klöckner"
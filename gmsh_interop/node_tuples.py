@@ -1,5 +1,6 @@
 # GENERATED by gmsh_interop/contrib/gmsh-node-tuples.py
 # GMSH_VERSION: 4.13.1
+# GENERATOR_HASH: caf3e8330ad1275b
 # DO NOT EDIT
 
 from collections.abc import Sequence
@@ -135,23 +136,23 @@ triangle_data: dict[int, ElementInfo] = {
             (2, 0),
             (3, 0),
             (4, 0),
-            (4, 0),
+            (5, 0),
             (6, 0),
             (6, 1),
-            (4, 2),
+            (5, 2),
             (4, 3),
             (3, 4),
-            (2, 4),
+            (2, 5),
             (1, 6),
             (0, 6),
-            (0, 4),
+            (0, 5),
             (0, 4),
             (0, 3),
             (0, 2),
             (0, 1),
             (1, 1),
-            (4, 1),
-            (1, 4),
+            (5, 1),
+            (1, 5),
             (2, 1),
             (3, 1),
             (4, 1),
@@ -230,18 +231,18 @@ triangle_data: dict[int, ElementInfo] = {
             (4, 0),
             (5, 0),
             (6, 0),
-            (6, 0),
+            (7, 0),
             (8, 0),
             (8, 1),
-            (6, 2),
+            (7, 2),
             (6, 3),
             (5, 4),
             (4, 5),
             (3, 6),
-            (2, 6),
+            (2, 7),
             (1, 8),
             (0, 8),
-            (0, 6),
+            (0, 7),
             (0, 6),
             (0, 5),
             (0, 4),
@@ -249,8 +250,8 @@ triangle_data: dict[int, ElementInfo] = {
             (0, 2),
             (0, 1),
             (1, 1),
-            (6, 1),
-            (1, 6),
+            (7, 1),
+            (1, 7),
             (2, 1),
             (3, 1),
             (4, 1),
@@ -605,41 +606,41 @@ tetrahedron_data: dict[int, ElementInfo] = {
             (2, 0, 0),
             (3, 0, 0),
             (4, 0, 0),
-            (4, 0, 0),
+            (5, 0, 0),
             (6, 0, 0),
             (6, 1, 0),
-            (4, 2, 0),
+            (5, 2, 0),
             (4, 3, 0),
             (3, 4, 0),
-            (2, 4, 0),
+            (2, 5, 0),
             (1, 6, 0),
             (0, 6, 0),
-            (0, 4, 0),
+            (0, 5, 0),
             (0, 4, 0),
             (0, 3, 0),
             (0, 2, 0),
             (0, 1, 0),
             (0, 0, 6),
-            (0, 0, 4),
+            (0, 0, 5),
             (0, 0, 4),
             (0, 0, 3),
             (0, 0, 2),
             (0, 0, 1),
             (0, 1, 6),
-            (0, 2, 4),
+            (0, 2, 5),
             (0, 3, 4),
             (0, 4, 3),
-            (0, 4, 2),
+            (0, 5, 2),
             (0, 6, 1),
             (1, 0, 6),
-            (2, 0, 4),
+            (2, 0, 5),
             (3, 0, 4),
             (4, 0, 3),
-            (4, 0, 2),
+            (5, 0, 2),
             (6, 0, 1),
             (1, 1, 0),
-            (1, 4, 0),
-            (4, 1, 0),
+            (1, 5, 0),
+            (5, 1, 0),
             (1, 2, 0),
             (1, 3, 0),
             (1, 4, 0),
@@ -653,8 +654,8 @@ tetrahedron_data: dict[int, ElementInfo] = {
             (2, 3, 0),
             (3, 2, 0),
             (1, 0, 1),
-            (4, 0, 1),
-            (1, 0, 4),
+            (5, 0, 1),
+            (1, 0, 5),
             (2, 0, 1),
             (3, 0, 1),
             (4, 0, 1),
@@ -668,8 +669,8 @@ tetrahedron_data: dict[int, ElementInfo] = {
             (3, 0, 2),
             (2, 0, 3),
             (0, 1, 1),
-            (0, 1, 4),
-            (0, 4, 1),
+            (0, 1, 5),
+            (0, 5, 1),
             (0, 1, 2),
             (0, 1, 3),
             (0, 1, 4),
@@ -682,9 +683,9 @@ tetrahedron_data: dict[int, ElementInfo] = {
             (0, 2, 2),
             (0, 2, 3),
             (0, 3, 2),
-            (1, 1, 4),
-            (4, 1, 1),
-            (1, 4, 1),
+            (1, 1, 5),
+            (5, 1, 1),
+            (1, 5, 1),
             (2, 1, 4),
             (3, 1, 3),
             (4, 1, 2),
@@ -904,18 +905,18 @@ tetrahedron_data: dict[int, ElementInfo] = {
             (4, 0, 0),
             (5, 0, 0),
             (6, 0, 0),
-            (6, 0, 0),
+            (7, 0, 0),
             (8, 0, 0),
             (8, 1, 0),
-            (6, 2, 0),
+            (7, 2, 0),
             (6, 3, 0),
             (5, 4, 0),
             (4, 5, 0),
             (3, 6, 0),
-            (2, 6, 0),
+            (2, 7, 0),
             (1, 8, 0),
             (0, 8, 0),
-            (0, 6, 0),
+            (0, 7, 0),
             (0, 6, 0),
             (0, 5, 0),
             (0, 4, 0),
@@ -923,7 +924,7 @@ tetrahedron_data: dict[int, ElementInfo] = {
             (0, 2, 0),
             (0, 1, 0),
             (0, 0, 8),
-            (0, 0, 6),
+            (0, 0, 7),
             (0, 0, 6),
             (0, 0, 5),
             (0, 0, 4),
@@ -931,24 +932,24 @@ tetrahedron_data: dict[int, ElementInfo] = {
             (0, 0, 2),
             (0, 0, 1),
             (0, 1, 8),
-            (0, 2, 6),
+            (0, 2, 7),
             (0, 3, 6),
             (0, 4, 5),
             (0, 5, 4),
             (0, 6, 3),
-            (0, 6, 2),
+            (0, 7, 2),
             (0, 8, 1),
             (1, 0, 8),
-            (2, 0, 6),
+            (2, 0, 7),
             (3, 0, 6),
             (4, 0, 5),
             (5, 0, 4),
             (6, 0, 3),
-            (6, 0, 2),
+            (7, 0, 2),
             (8, 0, 1),
             (1, 1, 0),
-            (1, 6, 0),
-            (6, 1, 0),
+            (1, 7, 0),
+            (7, 1, 0),
             (1, 2, 0),
             (1, 3, 0),
             (1, 4, 0),
@@ -975,8 +976,8 @@ tetrahedron_data: dict[int, ElementInfo] = {
             (3, 2, 0),
             (3, 3, 0),
             (1, 0, 1),
-            (6, 0, 1),
-            (1, 0, 6),
+            (7, 0, 1),
+            (1, 0, 7),
             (2, 0, 1),
             (3, 0, 1),
             (4, 0, 1),
@@ -1003,8 +1004,8 @@ tetrahedron_data: dict[int, ElementInfo] = {
             (2, 0, 3),
             (3, 0, 3),
             (0, 1, 1),
-            (0, 1, 6),
-            (0, 6, 1),
+            (0, 1, 7),
+            (0, 7, 1),
             (0, 1, 2),
             (0, 1, 3),
             (0, 1, 4),
@@ -1030,9 +1031,9 @@ tetrahedron_data: dict[int, ElementInfo] = {
             (0, 4, 2),
             (0, 3, 2),
             (0, 3, 3),
-            (1, 1, 6),
-            (6, 1, 1),
-            (1, 6, 1),
+            (1, 1, 7),
+            (7, 1, 1),
+            (1, 7, 1),
             (2, 1, 6),
             (3, 1, 5),
             (4, 1, 4),
@@ -1534,12 +1535,12 @@ quadrangle_data: dict[int, ElementInfo] = {
             (6, 0),
             (6, 6),
             (0, 6),
-            (0, 0),
+            (1, 0),
             (2, 0),
             (3, 0),
             (4, 0),
             (5, 0),
-            (6, 0),
+            (6, 1),
             (6, 2),
             (6, 3),
             (6, 4),
@@ -1548,28 +1549,28 @@ quadrangle_data: dict[int, ElementInfo] = {
             (4, 6),
             (3, 6),
             (2, 6),
-            (0, 6),
+            (1, 6),
             (0, 5),
             (0, 4),
             (0, 3),
             (0, 2),
-            (0, 0),
-            (0, 0),
-            (5, 0),
+            (0, 1),
+            (1, 1),
+            (5, 1),
             (5, 5),
-            (0, 5),
-            (2, 0),
-            (3, 0),
-            (4, 0),
+            (1, 5),
+            (2, 1),
+            (3, 1),
+            (4, 1),
             (5, 2),
             (5, 3),
             (5, 4),
             (4, 5),
             (3, 5),
             (2, 5),
-            (0, 4),
-            (0, 3),
-            (0, 2),
+            (1, 4),
+            (1, 3),
+            (1, 2),
             (2, 2),
             (4, 2),
             (4, 4),
@@ -1593,22 +1594,22 @@ quadrangle_data: dict[int, ElementInfo] = {
             (2, 0),
             (3, 0),
             (4, 0),
-            (4, 0),
+            (5, 0),
             (6, 0),
             (7, 1),
             (7, 2),
             (7, 3),
             (7, 4),
-            (7, 4),
+            (7, 5),
             (7, 6),
             (6, 7),
-            (4, 7),
+            (5, 7),
             (4, 7),
             (3, 7),
             (2, 7),
             (1, 7),
             (0, 6),
-            (0, 4),
+            (0, 5),
             (0, 4),
             (0, 3),
             (0, 2),
@@ -1620,29 +1621,29 @@ quadrangle_data: dict[int, ElementInfo] = {
             (2, 1),
             (3, 1),
             (4, 1),
-            (4, 1),
+            (5, 1),
             (6, 2),
             (6, 3),
             (6, 4),
-            (6, 4),
-            (4, 6),
+            (6, 5),
+            (5, 6),
             (4, 6),
             (3, 6),
             (2, 6),
-            (1, 4),
+            (1, 5),
             (1, 4),
             (1, 3),
             (1, 2),
             (2, 2),
-            (4, 2),
-            (4, 4),
-            (2, 4),
+            (5, 2),
+            (5, 5),
+            (2, 5),
             (3, 2),
             (4, 2),
-            (4, 3),
-            (4, 4),
-            (4, 4),
-            (3, 4),
+            (5, 3),
+            (5, 4),
+            (4, 5),
+            (3, 5),
             (2, 4),
             (2, 3),
             (3, 3),
@@ -1752,7 +1753,7 @@ quadrangle_data: dict[int, ElementInfo] = {
             (4, 0),
             (5, 0),
             (6, 0),
-            (6, 0),
+            (7, 0),
             (8, 0),
             (9, 1),
             (9, 2),
@@ -1760,10 +1761,10 @@ quadrangle_data: dict[int, ElementInfo] = {
             (9, 4),
             (9, 5),
             (9, 6),
-            (9, 6),
+            (9, 7),
             (9, 8),
             (8, 9),
-            (6, 9),
+            (7, 9),
             (6, 9),
             (5, 9),
             (4, 9),
@@ -1771,7 +1772,7 @@ quadrangle_data: dict[int, ElementInfo] = {
             (2, 9),
             (1, 9),
             (0, 8),
-            (0, 6),
+            (0, 7),
             (0, 6),
             (0, 5),
             (0, 4),
@@ -1787,41 +1788,41 @@ quadrangle_data: dict[int, ElementInfo] = {
             (4, 1),
             (5, 1),
             (6, 1),
-            (6, 1),
+            (7, 1),
             (8, 2),
             (8, 3),
             (8, 4),
             (8, 5),
             (8, 6),
-            (8, 6),
-            (6, 8),
+            (8, 7),
+            (7, 8),
             (6, 8),
             (5, 8),
             (4, 8),
             (3, 8),
             (2, 8),
-            (1, 6),
+            (1, 7),
             (1, 6),
             (1, 5),
             (1, 4),
             (1, 3),
             (1, 2),
             (2, 2),
-            (6, 2),
-            (6, 6),
-            (2, 6),
+            (7, 2),
+            (7, 7),
+            (2, 7),
             (3, 2),
             (4, 2),
             (5, 2),
             (6, 2),
-            (6, 3),
-            (6, 4),
-            (6, 5),
-            (6, 6),
-            (6, 6),
-            (5, 6),
-            (4, 6),
-            (3, 6),
+            (7, 3),
+            (7, 4),
+            (7, 5),
+            (7, 6),
+            (6, 7),
+            (5, 7),
+            (4, 7),
+            (3, 7),
             (2, 6),
             (2, 5),
             (2, 4),
@@ -1852,7 +1853,7 @@ quadrangle_data: dict[int, ElementInfo] = {
             (10, 0),
             (10, 10),
             (0, 10),
-            (0, 0),
+            (1, 0),
             (2, 0),
             (3, 0),
             (4, 0),
@@ -1861,7 +1862,7 @@ quadrangle_data: dict[int, ElementInfo] = {
             (7, 0),
             (8, 0),
             (9, 0),
-            (10, 0),
+            (10, 1),
             (10, 2),
             (10, 3),
             (10, 4),
@@ -1878,7 +1879,7 @@ quadrangle_data: dict[int, ElementInfo] = {
             (4, 10),
             (3, 10),
             (2, 10),
-            (0, 10),
+            (1, 10),
             (0, 9),
             (0, 8),
             (0, 7),
@@ -1887,18 +1888,18 @@ quadrangle_data: dict[int, ElementInfo] = {
             (0, 4),
             (0, 3),
             (0, 2),
-            (0, 0),
-            (0, 0),
-            (9, 0),
+            (0, 1),
+            (1, 1),
+            (9, 1),
             (9, 9),
-            (0, 9),
-            (2, 0),
-            (3, 0),
-            (4, 0),
-            (5, 0),
-            (6, 0),
-            (7, 0),
-            (8, 0),
+            (1, 9),
+            (2, 1),
+            (3, 1),
+            (4, 1),
+            (5, 1),
+            (6, 1),
+            (7, 1),
+            (8, 1),
             (9, 2),
             (9, 3),
             (9, 4),
@@ -1913,13 +1914,13 @@ quadrangle_data: dict[int, ElementInfo] = {
             (4, 9),
             (3, 9),
             (2, 9),
-            (0, 8),
-            (0, 7),
-            (0, 6),
-            (0, 5),
-            (0, 4),
-            (0, 3),
-            (0, 2),
+            (1, 8),
+            (1, 7),
+            (1, 6),
+            (1, 5),
+            (1, 4),
+            (1, 3),
+            (1, 2),
             (2, 2),
             (8, 2),
             (8, 8),
@@ -2456,27 +2457,27 @@ hexahedron_data: dict[int, ElementInfo] = {
             (6, 0, 6),
             (6, 6, 6),
             (0, 6, 6),
-            (0, 0, 0),
+            (1, 0, 0),
             (2, 0, 0),
             (3, 0, 0),
             (4, 0, 0),
             (5, 0, 0),
-            (0, 0, 0),
+            (0, 1, 0),
             (0, 2, 0),
             (0, 3, 0),
             (0, 4, 0),
             (0, 5, 0),
-            (0, 0, 0),
+            (0, 0, 1),
             (0, 0, 2),
             (0, 0, 3),
             (0, 0, 4),
             (0, 0, 5),
-            (6, 0, 0),
+            (6, 1, 0),
             (6, 2, 0),
             (6, 3, 0),
             (6, 4, 0),
             (6, 5, 0),
-            (6, 0, 0),
+            (6, 0, 1),
             (6, 0, 2),
             (6, 0, 3),
             (6, 0, 4),
@@ -2485,28 +2486,28 @@ hexahedron_data: dict[int, ElementInfo] = {
             (4, 6, 0),
             (3, 6, 0),
             (2, 6, 0),
-            (0, 6, 0),
-            (6, 6, 0),
+            (1, 6, 0),
+            (6, 6, 1),
             (6, 6, 2),
             (6, 6, 3),
             (6, 6, 4),
             (6, 6, 5),
-            (0, 6, 0),
+            (0, 6, 1),
             (0, 6, 2),
             (0, 6, 3),
             (0, 6, 4),
             (0, 6, 5),
-            (0, 0, 6),
+            (1, 0, 6),
             (2, 0, 6),
             (3, 0, 6),
             (4, 0, 6),
             (5, 0, 6),
-            (0, 0, 6),
+            (0, 1, 6),
             (0, 2, 6),
             (0, 3, 6),
             (0, 4, 6),
             (0, 5, 6),
-            (6, 0, 6),
+            (6, 1, 6),
             (6, 2, 6),
             (6, 3, 6),
             (6, 4, 6),
@@ -2515,23 +2516,23 @@ hexahedron_data: dict[int, ElementInfo] = {
             (4, 6, 6),
             (3, 6, 6),
             (2, 6, 6),
-            (0, 6, 6),
-            (0, 0, 0),
-            (0, 5, 0),
-            (5, 5, 0),
-            (5, 0, 0),
-            (0, 2, 0),
-            (0, 3, 0),
-            (0, 4, 0),
+            (1, 6, 6),
+            (1, 1, 0),
+            (1, 5, 0),
+            (5, 5, 0),
+            (5, 1, 0),
+            (1, 2, 0),
+            (1, 3, 0),
+            (1, 4, 0),
             (2, 5, 0),
             (3, 5, 0),
             (4, 5, 0),
             (5, 4, 0),
             (5, 3, 0),
             (5, 2, 0),
-            (4, 0, 0),
-            (3, 0, 0),
-            (2, 0, 0),
+            (4, 1, 0),
+            (3, 1, 0),
+            (2, 1, 0),
             (2, 2, 0),
             (2, 4, 0),
             (4, 4, 0),
@@ -2541,22 +2542,22 @@ hexahedron_data: dict[int, ElementInfo] = {
             (4, 3, 0),
             (3, 2, 0),
             (3, 3, 0),
-            (0, 0, 0),
-            (5, 0, 0),
+            (1, 0, 1),
+            (5, 0, 1),
             (5, 0, 5),
-            (0, 0, 5),
-            (2, 0, 0),
-            (3, 0, 0),
-            (4, 0, 0),
+            (1, 0, 5),
+            (2, 0, 1),
+            (3, 0, 1),
+            (4, 0, 1),
             (5, 0, 2),
             (5, 0, 3),
             (5, 0, 4),
             (4, 0, 5),
             (3, 0, 5),
             (2, 0, 5),
-            (0, 0, 4),
-            (0, 0, 3),
-            (0, 0, 2),
+            (1, 0, 4),
+            (1, 0, 3),
+            (1, 0, 2),
             (2, 0, 2),
             (4, 0, 2),
             (4, 0, 4),
@@ -2566,22 +2567,22 @@ hexahedron_data: dict[int, ElementInfo] = {
             (3, 0, 4),
             (2, 0, 3),
             (3, 0, 3),
-            (0, 0, 0),
-            (0, 0, 5),
+            (0, 1, 1),
+            (0, 1, 5),
             (0, 5, 5),
-            (0, 5, 0),
-            (0, 0, 2),
-            (0, 0, 3),
-            (0, 0, 4),
+            (0, 5, 1),
+            (0, 1, 2),
+            (0, 1, 3),
+            (0, 1, 4),
             (0, 2, 5),
             (0, 3, 5),
             (0, 4, 5),
             (0, 5, 4),
             (0, 5, 3),
             (0, 5, 2),
-            (0, 4, 0),
-            (0, 3, 0),
-            (0, 2, 0),
+            (0, 4, 1),
+            (0, 3, 1),
+            (0, 2, 1),
             (0, 2, 2),
             (0, 2, 4),
             (0, 4, 4),
@@ -2591,22 +2592,22 @@ hexahedron_data: dict[int, ElementInfo] = {
             (0, 4, 3),
             (0, 3, 2),
             (0, 3, 3),
-            (6, 0, 0),
-            (6, 5, 0),
+            (6, 1, 1),
+            (6, 5, 1),
             (6, 5, 5),
-            (6, 0, 5),
-            (6, 2, 0),
-            (6, 3, 0),
-            (6, 4, 0),
+            (6, 1, 5),
+            (6, 2, 1),
+            (6, 3, 1),
+            (6, 4, 1),
             (6, 5, 2),
             (6, 5, 3),
             (6, 5, 4),
             (6, 4, 5),
             (6, 3, 5),
             (6, 2, 5),
-            (6, 0, 4),
-            (6, 0, 3),
-            (6, 0, 2),
+            (6, 1, 4),
+            (6, 1, 3),
+            (6, 1, 2),
             (6, 2, 2),
             (6, 4, 2),
             (6, 4, 4),
@@ -2616,16 +2617,16 @@ hexahedron_data: dict[int, ElementInfo] = {
             (6, 3, 4),
             (6, 2, 3),
             (6, 3, 3),
-            (5, 6, 0),
-            (0, 6, 0),
-            (0, 6, 5),
+            (5, 6, 1),
+            (1, 6, 1),
+            (1, 6, 5),
             (5, 6, 5),
-            (4, 6, 0),
-            (3, 6, 0),
-            (2, 6, 0),
-            (0, 6, 2),
-            (0, 6, 3),
-            (0, 6, 4),
+            (4, 6, 1),
+            (3, 6, 1),
+            (2, 6, 1),
+            (1, 6, 2),
+            (1, 6, 3),
+            (1, 6, 4),
             (2, 6, 5),
             (3, 6, 5),
             (4, 6, 5),
@@ -2641,22 +2642,22 @@ hexahedron_data: dict[int, ElementInfo] = {
             (3, 6, 4),
             (4, 6, 3),
             (3, 6, 3),
-            (0, 0, 6),
-            (5, 0, 6),
+            (1, 1, 6),
+            (5, 1, 6),
             (5, 5, 6),
-            (0, 5, 6),
-            (2, 0, 6),
-            (3, 0, 6),
-            (4, 0, 6),
+            (1, 5, 6),
+            (2, 1, 6),
+            (3, 1, 6),
+            (4, 1, 6),
             (5, 2, 6),
             (5, 3, 6),
             (5, 4, 6),
             (4, 5, 6),
             (3, 5, 6),
             (2, 5, 6),
-            (0, 4, 6),
-            (0, 3, 6),
-            (0, 2, 6),
+            (1, 4, 6),
+            (1, 3, 6),
+            (1, 2, 6),
             (2, 2, 6),
             (4, 2, 6),
             (4, 4, 6),
@@ -2666,77 +2667,77 @@ hexahedron_data: dict[int, ElementInfo] = {
             (3, 4, 6),
             (2, 3, 6),
             (3, 3, 6),
-            (0, 0, 0),
-            (5, 0, 0),
-            (5, 5, 0),
-            (0, 5, 0),
-            (0, 0, 5),
-            (5, 0, 5),
+            (1, 1, 1),
+            (5, 1, 1),
+            (5, 5, 1),
+            (1, 5, 1),
+            (1, 1, 5),
+            (5, 1, 5),
             (5, 5, 5),
-            (0, 5, 5),
-            (2, 0, 0),
-            (3, 0, 0),
-            (4, 0, 0),
-            (0, 2, 0),
-            (0, 3, 0),
-            (0, 4, 0),
-            (0, 0, 2),
-            (0, 0, 3),
-            (0, 0, 4),
-            (5, 2, 0),
-            (5, 3, 0),
-            (5, 4, 0),
-            (5, 0, 2),
-            (5, 0, 3),
-            (5, 0, 4),
-            (4, 5, 0),
-            (3, 5, 0),
-            (2, 5, 0),
+            (1, 5, 5),
+            (2, 1, 1),
+            (3, 1, 1),
+            (4, 1, 1),
+            (1, 2, 1),
+            (1, 3, 1),
+            (1, 4, 1),
+            (1, 1, 2),
+            (1, 1, 3),
+            (1, 1, 4),
+            (5, 2, 1),
+            (5, 3, 1),
+            (5, 4, 1),
+            (5, 1, 2),
+            (5, 1, 3),
+            (5, 1, 4),
+            (4, 5, 1),
+            (3, 5, 1),
+            (2, 5, 1),
             (5, 5, 2),
             (5, 5, 3),
             (5, 5, 4),
-            (0, 5, 2),
-            (0, 5, 3),
-            (0, 5, 4),
-            (2, 0, 5),
-            (3, 0, 5),
-            (4, 0, 5),
-            (0, 2, 5),
-            (0, 3, 5),
-            (0, 4, 5),
+            (1, 5, 2),
+            (1, 5, 3),
+            (1, 5, 4),
+            (2, 1, 5),
+            (3, 1, 5),
+            (4, 1, 5),
+            (1, 2, 5),
+            (1, 3, 5),
+            (1, 4, 5),
             (5, 2, 5),
             (5, 3, 5),
             (5, 4, 5),
             (4, 5, 5),
             (3, 5, 5),
             (2, 5, 5),
-            (2, 2, 0),
-            (2, 4, 0),
-            (4, 4, 0),
-            (4, 2, 0),
-            (2, 3, 0),
-            (3, 4, 0),
-            (4, 3, 0),
-            (3, 2, 0),
-            (3, 3, 0),
-            (2, 0, 2),
-            (4, 0, 2),
-            (4, 0, 4),
-            (2, 0, 4),
-            (3, 0, 2),
-            (4, 0, 3),
-            (3, 0, 4),
-            (2, 0, 3),
-            (3, 0, 3),
-            (0, 2, 2),
-            (0, 2, 4),
-            (0, 4, 4),
-            (0, 4, 2),
-            (0, 2, 3),
-            (0, 3, 4),
-            (0, 4, 3),
-            (0, 3, 2),
-            (0, 3, 3),
+            (2, 2, 1),
+            (2, 4, 1),
+            (4, 4, 1),
+            (4, 2, 1),
+            (2, 3, 1),
+            (3, 4, 1),
+            (4, 3, 1),
+            (3, 2, 1),
+            (3, 3, 1),
+            (2, 1, 2),
+            (4, 1, 2),
+            (4, 1, 4),
+            (2, 1, 4),
+            (3, 1, 2),
+            (4, 1, 3),
+            (3, 1, 4),
+            (2, 1, 3),
+            (3, 1, 3),
+            (1, 2, 2),
+            (1, 2, 4),
+            (1, 4, 4),
+            (1, 4, 2),
+            (1, 2, 3),
+            (1, 3, 4),
+            (1, 4, 3),
+            (1, 3, 2),
+            (1, 3, 3),
             (5, 2, 2),
             (5, 4, 2),
             (5, 4, 4),
@@ -2809,34 +2810,34 @@ hexahedron_data: dict[int, ElementInfo] = {
             (2, 0, 0),
             (3, 0, 0),
             (4, 0, 0),
-            (4, 0, 0),
+            (5, 0, 0),
             (6, 0, 0),
             (0, 1, 0),
             (0, 2, 0),
             (0, 3, 0),
             (0, 4, 0),
-            (0, 4, 0),
+            (0, 5, 0),
             (0, 6, 0),
             (0, 0, 1),
             (0, 0, 2),
             (0, 0, 3),
             (0, 0, 4),
-            (0, 0, 4),
+            (0, 0, 5),
             (0, 0, 6),
             (7, 1, 0),
             (7, 2, 0),
             (7, 3, 0),
             (7, 4, 0),
-            (7, 4, 0),
+            (7, 5, 0),
             (7, 6, 0),
             (7, 0, 1),
             (7, 0, 2),
             (7, 0, 3),
             (7, 0, 4),
-            (7, 0, 4),
+            (7, 0, 5),
             (7, 0, 6),
             (6, 7, 0),
-            (4, 7, 0),
+            (5, 7, 0),
             (4, 7, 0),
             (3, 7, 0),
             (2, 7, 0),
@@ -2845,34 +2846,34 @@ hexahedron_data: dict[int, ElementInfo] = {
             (7, 7, 2),
             (7, 7, 3),
             (7, 7, 4),
-            (7, 7, 4),
+            (7, 7, 5),
             (7, 7, 6),
             (0, 7, 1),
             (0, 7, 2),
             (0, 7, 3),
             (0, 7, 4),
-            (0, 7, 4),
+            (0, 7, 5),
             (0, 7, 6),
             (1, 0, 7),
             (2, 0, 7),
             (3, 0, 7),
             (4, 0, 7),
-            (4, 0, 7),
+            (5, 0, 7),
             (6, 0, 7),
             (0, 1, 7),
             (0, 2, 7),
             (0, 3, 7),
             (0, 4, 7),
-            (0, 4, 7),
+            (0, 5, 7),
             (0, 6, 7),
             (7, 1, 7),
             (7, 2, 7),
             (7, 3, 7),
             (7, 4, 7),
-            (7, 4, 7),
+            (7, 5, 7),
             (7, 6, 7),
             (6, 7, 7),
-            (4, 7, 7),
+            (5, 7, 7),
             (4, 7, 7),
             (3, 7, 7),
             (2, 7, 7),
@@ -2884,29 +2885,29 @@ hexahedron_data: dict[int, ElementInfo] = {
             (1, 2, 0),
             (1, 3, 0),
             (1, 4, 0),
-            (1, 4, 0),
+            (1, 5, 0),
             (2, 6, 0),
             (3, 6, 0),
             (4, 6, 0),
-            (4, 6, 0),
-            (6, 4, 0),
+            (5, 6, 0),
+            (6, 5, 0),
             (6, 4, 0),
             (6, 3, 0),
             (6, 2, 0),
-            (4, 1, 0),
+            (5, 1, 0),
             (4, 1, 0),
             (3, 1, 0),
             (2, 1, 0),
             (2, 2, 0),
-            (2, 4, 0),
-            (4, 4, 0),
-            (4, 2, 0),
+            (2, 5, 0),
+            (5, 5, 0),
+            (5, 2, 0),
             (2, 3, 0),
             (2, 4, 0),
-            (3, 4, 0),
-            (4, 4, 0),
-            (4, 4, 0),
-            (4, 3, 0),
+            (3, 5, 0),
+            (4, 5, 0),
+            (5, 4, 0),
+            (5, 3, 0),
             (4, 2, 0),
             (3, 2, 0),
             (3, 3, 0),
@@ -2920,29 +2921,29 @@ hexahedron_data: dict[int, ElementInfo] = {
             (2, 0, 1),
             (3, 0, 1),
             (4, 0, 1),
-            (4, 0, 1),
+            (5, 0, 1),
             (6, 0, 2),
             (6, 0, 3),
             (6, 0, 4),
-            (6, 0, 4),
-            (4, 0, 6),
+            (6, 0, 5),
+            (5, 0, 6),
             (4, 0, 6),
             (3, 0, 6),
             (2, 0, 6),
-            (1, 0, 4),
+            (1, 0, 5),
             (1, 0, 4),
             (1, 0, 3),
             (1, 0, 2),
             (2, 0, 2),
-            (4, 0, 2),
-            (4, 0, 4),
-            (2, 0, 4),
+            (5, 0, 2),
+            (5, 0, 5),
+            (2, 0, 5),
             (3, 0, 2),
             (4, 0, 2),
-            (4, 0, 3),
-            (4, 0, 4),
-            (4, 0, 4),
-            (3, 0, 4),
+            (5, 0, 3),
+            (5, 0, 4),
+            (4, 0, 5),
+            (3, 0, 5),
             (2, 0, 4),
             (2, 0, 3),
             (3, 0, 3),
@@ -2956,29 +2957,29 @@ hexahedron_data: dict[int, ElementInfo] = {
             (0, 1, 2),
             (0, 1, 3),
             (0, 1, 4),
-            (0, 1, 4),
+            (0, 1, 5),
             (0, 2, 6),
             (0, 3, 6),
             (0, 4, 6),
-            (0, 4, 6),
-            (0, 6, 4),
+            (0, 5, 6),
+            (0, 6, 5),
             (0, 6, 4),
             (0, 6, 3),
             (0, 6, 2),
-            (0, 4, 1),
+            (0, 5, 1),
             (0, 4, 1),
             (0, 3, 1),
             (0, 2, 1),
             (0, 2, 2),
-            (0, 2, 4),
-            (0, 4, 4),
-            (0, 4, 2),
+            (0, 2, 5),
+            (0, 5, 5),
+            (0, 5, 2),
             (0, 2, 3),
             (0, 2, 4),
-            (0, 3, 4),
-            (0, 4, 4),
-            (0, 4, 4),
-            (0, 4, 3),
+            (0, 3, 5),
+            (0, 4, 5),
+            (0, 5, 4),
+            (0, 5, 3),
             (0, 4, 2),
             (0, 3, 2),
             (0, 3, 3),
@@ -2992,29 +2993,29 @@ hexahedron_data: dict[int, ElementInfo] = {
             (7, 2, 1),
             (7, 3, 1),
             (7, 4, 1),
-            (7, 4, 1),
+            (7, 5, 1),
             (7, 6, 2),
             (7, 6, 3),
             (7, 6, 4),
-            (7, 6, 4),
-            (7, 4, 6),
+            (7, 6, 5),
+            (7, 5, 6),
             (7, 4, 6),
             (7, 3, 6),
             (7, 2, 6),
-            (7, 1, 4),
+            (7, 1, 5),
             (7, 1, 4),
             (7, 1, 3),
             (7, 1, 2),
             (7, 2, 2),
-            (7, 4, 2),
-            (7, 4, 4),
-            (7, 2, 4),
+            (7, 5, 2),
+            (7, 5, 5),
+            (7, 2, 5),
             (7, 3, 2),
             (7, 4, 2),
-            (7, 4, 3),
-            (7, 4, 4),
-            (7, 4, 4),
-            (7, 3, 4),
+            (7, 5, 3),
+            (7, 5, 4),
+            (7, 4, 5),
+            (7, 3, 5),
             (7, 2, 4),
             (7, 2, 3),
             (7, 3, 3),
@@ -3025,34 +3026,34 @@ hexahedron_data: dict[int, ElementInfo] = {
             (1, 7, 1),
             (1, 7, 6),
             (6, 7, 6),
-            (4, 7, 1),
+            (5, 7, 1),
             (4, 7, 1),
             (3, 7, 1),
             (2, 7, 1),
             (1, 7, 2),
             (1, 7, 3),
             (1, 7, 4),
-            (1, 7, 4),
+            (1, 7, 5),
             (2, 7, 6),
             (3, 7, 6),
             (4, 7, 6),
-            (4, 7, 6),
-            (6, 7, 4),
+            (5, 7, 6),
+            (6, 7, 5),
             (6, 7, 4),
             (6, 7, 3),
             (6, 7, 2),
-            (4, 7, 2),
+            (5, 7, 2),
             (2, 7, 2),
-            (2, 7, 4),
-            (4, 7, 4),
+            (2, 7, 5),
+            (5, 7, 5),
             (4, 7, 2),
             (3, 7, 2),
             (2, 7, 3),
             (2, 7, 4),
-            (3, 7, 4),
-            (4, 7, 4),
-            (4, 7, 4),
-            (4, 7, 3),
+            (3, 7, 5),
+            (4, 7, 5),
+            (5, 7, 4),
+            (5, 7, 3),
             (4, 7, 3),
             (3, 7, 3),
             (3, 7, 4),
@@ -3064,29 +3065,29 @@ hexahedron_data: dict[int, ElementInfo] = {
             (2, 1, 7),
             (3, 1, 7),
             (4, 1, 7),
-            (4, 1, 7),
+            (5, 1, 7),
             (6, 2, 7),
             (6, 3, 7),
             (6, 4, 7),
-            (6, 4, 7),
-            (4, 6, 7),
+            (6, 5, 7),
+            (5, 6, 7),
             (4, 6, 7),
             (3, 6, 7),
             (2, 6, 7),
-            (1, 4, 7),
+            (1, 5, 7),
             (1, 4, 7),
             (1, 3, 7),
             (1, 2, 7),
             (2, 2, 7),
-            (4, 2, 7),
-            (4, 4, 7),
-            (2, 4, 7),
+            (5, 2, 7),
+            (5, 5, 7),
+            (2, 5, 7),
             (3, 2, 7),
             (4, 2, 7),
-            (4, 3, 7),
-            (4, 4, 7),
-            (4, 4, 7),
-            (3, 4, 7),
+            (5, 3, 7),
+            (5, 4, 7),
+            (4, 5, 7),
+            (3, 5, 7),
             (2, 4, 7),
             (2, 3, 7),
             (3, 3, 7),
@@ -3104,61 +3105,61 @@ hexahedron_data: dict[int, ElementInfo] = {
             (2, 1, 1),
             (3, 1, 1),
             (4, 1, 1),
-            (4, 1, 1),
+            (5, 1, 1),
             (1, 2, 1),
             (1, 3, 1),
             (1, 4, 1),
-            (1, 4, 1),
+            (1, 5, 1),
             (1, 1, 2),
             (1, 1, 3),
             (1, 1, 4),
-            (1, 1, 4),
+            (1, 1, 5),
             (6, 2, 1),
             (6, 3, 1),
             (6, 4, 1),
-            (6, 4, 1),
+            (6, 5, 1),
             (6, 1, 2),
             (6, 1, 3),
             (6, 1, 4),
-            (6, 1, 4),
-            (4, 6, 1),
+            (6, 1, 5),
+            (5, 6, 1),
             (4, 6, 1),
             (3, 6, 1),
             (2, 6, 1),
             (6, 6, 2),
             (6, 6, 3),
             (6, 6, 4),
-            (6, 6, 4),
+            (6, 6, 5),
             (1, 6, 2),
             (1, 6, 3),
             (1, 6, 4),
-            (1, 6, 4),
+            (1, 6, 5),
             (2, 1, 6),
             (3, 1, 6),
             (4, 1, 6),
-            (4, 1, 6),
+            (5, 1, 6),
             (1, 2, 6),
             (1, 3, 6),
             (1, 4, 6),
-            (1, 4, 6),
+            (1, 5, 6),
             (6, 2, 6),
             (6, 3, 6),
             (6, 4, 6),
-            (6, 4, 6),
-            (4, 6, 6),
+            (6, 5, 6),
+            (5, 6, 6),
             (4, 6, 6),
             (3, 6, 6),
             (2, 6, 6),
             (2, 2, 1),
-            (2, 4, 1),
-            (4, 4, 1),
-            (4, 2, 1),
+            (2, 5, 1),
+            (5, 5, 1),
+            (5, 2, 1),
             (2, 3, 1),
             (2, 4, 1),
-            (3, 4, 1),
-            (4, 4, 1),
-            (4, 4, 1),
-            (4, 3, 1),
+            (3, 5, 1),
+            (4, 5, 1),
+            (5, 4, 1),
+            (5, 3, 1),
             (4, 2, 1),
             (3, 2, 1),
             (3, 3, 1),
@@ -3166,15 +3167,15 @@ hexahedron_data: dict[int, ElementInfo] = {
             (4, 4, 1),
             (4, 3, 1),
             (2, 1, 2),
-            (4, 1, 2),
-            (4, 1, 4),
-            (2, 1, 4),
+            (5, 1, 2),
+            (5, 1, 5),
+            (2, 1, 5),
             (3, 1, 2),
             (4, 1, 2),
-            (4, 1, 3),
-            (4, 1, 4),
-            (4, 1, 4),
-            (3, 1, 4),
+            (5, 1, 3),
+            (5, 1, 4),
+            (4, 1, 5),
+            (3, 1, 5),
             (2, 1, 4),
             (2, 1, 3),
             (3, 1, 3),
@@ -3182,15 +3183,15 @@ hexahedron_data: dict[int, ElementInfo] = {
             (4, 1, 4),
             (3, 1, 4),
             (1, 2, 2),
-            (1, 2, 4),
-            (1, 4, 4),
-            (1, 4, 2),
+            (1, 2, 5),
+            (1, 5, 5),
+            (1, 5, 2),
             (1, 2, 3),
             (1, 2, 4),
-            (1, 3, 4),
-            (1, 4, 4),
-            (1, 4, 4),
-            (1, 4, 3),
+            (1, 3, 5),
+            (1, 4, 5),
+            (1, 5, 4),
+            (1, 5, 3),
             (1, 4, 2),
             (1, 3, 2),
             (1, 3, 3),
@@ -3198,47 +3199,47 @@ hexahedron_data: dict[int, ElementInfo] = {
             (1, 4, 4),
             (1, 4, 3),
             (6, 2, 2),
-            (6, 4, 2),
-            (6, 4, 4),
-            (6, 2, 4),
+            (6, 5, 2),
+            (6, 5, 5),
+            (6, 2, 5),
             (6, 3, 2),
             (6, 4, 2),
-            (6, 4, 3),
-            (6, 4, 4),
-            (6, 4, 4),
-            (6, 3, 4),
+            (6, 5, 3),
+            (6, 5, 4),
+            (6, 4, 5),
+            (6, 3, 5),
             (6, 2, 4),
             (6, 2, 3),
             (6, 3, 3),
             (6, 4, 3),
             (6, 4, 4),
             (6, 3, 4),
-            (4, 6, 2),
+            (5, 6, 2),
             (2, 6, 2),
-            (2, 6, 4),
-            (4, 6, 4),
+            (2, 6, 5),
+            (5, 6, 5),
             (4, 6, 2),
             (3, 6, 2),
             (2, 6, 3),
             (2, 6, 4),
-            (3, 6, 4),
-            (4, 6, 4),
-            (4, 6, 4),
-            (4, 6, 3),
+            (3, 6, 5),
+            (4, 6, 5),
+            (5, 6, 4),
+            (5, 6, 3),
             (4, 6, 3),
             (3, 6, 3),
             (3, 6, 4),
             (4, 6, 4),
             (2, 2, 6),
-            (4, 2, 6),
-            (4, 4, 6),
-            (2, 4, 6),
+            (5, 2, 6),
+            (5, 5, 6),
+            (2, 5, 6),
             (3, 2, 6),
             (4, 2, 6),
-            (4, 3, 6),
-            (4, 4, 6),
-            (4, 4, 6),
-            (3, 4, 6),
+            (5, 3, 6),
+            (5, 4, 6),
+            (4, 5, 6),
+            (3, 5, 6),
             (2, 4, 6),
             (2, 3, 6),
             (3, 3, 6),
@@ -3246,37 +3247,37 @@ hexahedron_data: dict[int, ElementInfo] = {
             (4, 4, 6),
             (3, 4, 6),
             (2, 2, 2),
-            (4, 2, 2),
-            (4, 4, 2),
-            (2, 4, 2),
-            (2, 2, 4),
-            (4, 2, 4),
-            (4, 4, 4),
-            (2, 4, 4),
+            (5, 2, 2),
+            (5, 5, 2),
+            (2, 5, 2),
+            (2, 2, 5),
+            (5, 2, 5),
+            (5, 5, 5),
+            (2, 5, 5),
             (3, 2, 2),
             (4, 2, 2),
             (2, 3, 2),
             (2, 4, 2),
             (2, 2, 3),
             (2, 2, 4),
-            (4, 3, 2),
-            (4, 4, 2),
-            (4, 2, 3),
-            (4, 2, 4),
-            (4, 4, 2),
-            (3, 4, 2),
-            (4, 4, 3),
-            (4, 4, 4),
-            (2, 4, 3),
-            (2, 4, 4),
-            (3, 2, 4),
-            (4, 2, 4),
-            (2, 3, 4),
-            (2, 4, 4),
-            (4, 3, 4),
-            (4, 4, 4),
-            (4, 4, 4),
-            (3, 4, 4),
+            (5, 3, 2),
+            (5, 4, 2),
+            (5, 2, 3),
+            (5, 2, 4),
+            (4, 5, 2),
+            (3, 5, 2),
+            (5, 5, 3),
+            (5, 5, 4),
+            (2, 5, 3),
+            (2, 5, 4),
+            (3, 2, 5),
+            (4, 2, 5),
+            (2, 3, 5),
+            (2, 4, 5),
+            (5, 3, 5),
+            (5, 4, 5),
+            (4, 5, 5),
+            (3, 5, 5),
             (3, 3, 2),
             (3, 4, 2),
             (4, 4, 2),
@@ -3289,18 +3290,18 @@ hexahedron_data: dict[int, ElementInfo] = {
             (2, 3, 4),
             (2, 4, 4),
             (2, 4, 3),
-            (4, 3, 3),
-            (4, 4, 3),
-            (4, 4, 4),
-            (4, 3, 4),
-            (4, 4, 3),
-            (3, 4, 3),
-            (3, 4, 4),
-            (4, 4, 4),
-            (3, 3, 4),
-            (4, 3, 4),
-            (4, 4, 4),
-            (3, 4, 4),
+            (5, 3, 3),
+            (5, 4, 3),
+            (5, 4, 4),
+            (5, 3, 4),
+            (4, 5, 3),
+            (3, 5, 3),
+            (3, 5, 4),
+            (4, 5, 4),
+            (3, 3, 5),
+            (4, 3, 5),
+            (4, 4, 5),
+            (3, 4, 5),
             (3, 3, 3),
             (4, 3, 3),
             (4, 4, 3),
@@ -4064,7 +4065,7 @@ hexahedron_data: dict[int, ElementInfo] = {
             (4, 0, 0),
             (5, 0, 0),
             (6, 0, 0),
-            (6, 0, 0),
+            (7, 0, 0),
             (8, 0, 0),
             (0, 1, 0),
             (0, 2, 0),
@@ -4072,7 +4073,7 @@ hexahedron_data: dict[int, ElementInfo] = {
             (0, 4, 0),
             (0, 5, 0),
             (0, 6, 0),
-            (0, 6, 0),
+            (0, 7, 0),
             (0, 8, 0),
             (0, 0, 1),
             (0, 0, 2),
@@ -4080,7 +4081,7 @@ hexahedron_data: dict[int, ElementInfo] = {
             (0, 0, 4),
             (0, 0, 5),
             (0, 0, 6),
-            (0, 0, 6),
+            (0, 0, 7),
             (0, 0, 8),
             (9, 1, 0),
             (9, 2, 0),
@@ -4088,7 +4089,7 @@ hexahedron_data: dict[int, ElementInfo] = {
             (9, 4, 0),
             (9, 5, 0),
             (9, 6, 0),
-            (9, 6, 0),
+            (9, 7, 0),
             (9, 8, 0),
             (9, 0, 1),
             (9, 0, 2),
@@ -4096,10 +4097,10 @@ hexahedron_data: dict[int, ElementInfo] = {
             (9, 0, 4),
             (9, 0, 5),
             (9, 0, 6),
-            (9, 0, 6),
+            (9, 0, 7),
             (9, 0, 8),
             (8, 9, 0),
-            (6, 9, 0),
+            (7, 9, 0),
             (6, 9, 0),
             (5, 9, 0),
             (4, 9, 0),
@@ -4112,7 +4113,7 @@ hexahedron_data: dict[int, ElementInfo] = {
             (9, 9, 4),
             (9, 9, 5),
             (9, 9, 6),
-            (9, 9, 6),
+            (9, 9, 7),
             (9, 9, 8),
             (0, 9, 1),
             (0, 9, 2),
@@ -4120,7 +4121,7 @@ hexahedron_data: dict[int, ElementInfo] = {
             (0, 9, 4),
             (0, 9, 5),
             (0, 9, 6),
-            (0, 9, 6),
+            (0, 9, 7),
             (0, 9, 8),
             (1, 0, 9),
             (2, 0, 9),
@@ -4128,7 +4129,7 @@ hexahedron_data: dict[int, ElementInfo] = {
             (4, 0, 9),
             (5, 0, 9),
             (6, 0, 9),
-            (6, 0, 9),
+            (7, 0, 9),
             (8, 0, 9),
             (0, 1, 9),
             (0, 2, 9),
@@ -4136,7 +4137,7 @@ hexahedron_data: dict[int, ElementInfo] = {
             (0, 4, 9),
             (0, 5, 9),
             (0, 6, 9),
-            (0, 6, 9),
+            (0, 7, 9),
             (0, 8, 9),
             (9, 1, 9),
             (9, 2, 9),
@@ -4144,10 +4145,10 @@ hexahedron_data: dict[int, ElementInfo] = {
             (9, 4, 9),
             (9, 5, 9),
             (9, 6, 9),
-            (9, 6, 9),
+            (9, 7, 9),
             (9, 8, 9),
             (8, 9, 9),
-            (6, 9, 9),
+            (7, 9, 9),
             (6, 9, 9),
             (5, 9, 9),
             (4, 9, 9),
@@ -4163,41 +4164,41 @@ hexahedron_data: dict[int, ElementInfo] = {
             (1, 4, 0),
             (1, 5, 0),
             (1, 6, 0),
-            (1, 6, 0),
+            (1, 7, 0),
             (2, 8, 0),
             (3, 8, 0),
             (4, 8, 0),
             (5, 8, 0),
             (6, 8, 0),
-            (6, 8, 0),
-            (8, 6, 0),
+            (7, 8, 0),
+            (8, 7, 0),
             (8, 6, 0),
             (8, 5, 0),
             (8, 4, 0),
             (8, 3, 0),
             (8, 2, 0),
-            (6, 1, 0),
+            (7, 1, 0),
             (6, 1, 0),
             (5, 1, 0),
             (4, 1, 0),
             (3, 1, 0),
             (2, 1, 0),
             (2, 2, 0),
-            (2, 6, 0),
-            (6, 6, 0),
-            (6, 2, 0),
+            (2, 7, 0),
+            (7, 7, 0),
+            (7, 2, 0),
             (2, 3, 0),
             (2, 4, 0),
             (2, 5, 0),
             (2, 6, 0),
-            (3, 6, 0),
-            (4, 6, 0),
-            (5, 6, 0),
-            (6, 6, 0),
-            (6, 6, 0),
-            (6, 5, 0),
-            (6, 4, 0),
-            (6, 3, 0),
+            (3, 7, 0),
+            (4, 7, 0),
+            (5, 7, 0),
+            (6, 7, 0),
+            (7, 6, 0),
+            (7, 5, 0),
+            (7, 4, 0),
+            (7, 3, 0),
             (6, 2, 0),
             (5, 2, 0),
             (4, 2, 0),
@@ -4227,41 +4228,41 @@ hexahedron_data: dict[int, ElementInfo] = {
             (4, 0, 1),
             (5, 0, 1),
             (6, 0, 1),
-            (6, 0, 1),
+            (7, 0, 1),
             (8, 0, 2),
             (8, 0, 3),
             (8, 0, 4),
             (8, 0, 5),
             (8, 0, 6),
-            (8, 0, 6),
-            (6, 0, 8),
+            (8, 0, 7),
+            (7, 0, 8),
             (6, 0, 8),
             (5, 0, 8),
             (4, 0, 8),
             (3, 0, 8),
             (2, 0, 8),
-            (1, 0, 6),
+            (1, 0, 7),
             (1, 0, 6),
             (1, 0, 5),
             (1, 0, 4),
             (1, 0, 3),
             (1, 0, 2),
             (2, 0, 2),
-            (6, 0, 2),
-            (6, 0, 6),
-            (2, 0, 6),
+            (7, 0, 2),
+            (7, 0, 7),
+            (2, 0, 7),
             (3, 0, 2),
             (4, 0, 2),
             (5, 0, 2),
             (6, 0, 2),
-            (6, 0, 3),
-            (6, 0, 4),
-            (6, 0, 5),
-            (6, 0, 6),
-            (6, 0, 6),
-            (5, 0, 6),
-            (4, 0, 6),
-            (3, 0, 6),
+            (7, 0, 3),
+            (7, 0, 4),
+            (7, 0, 5),
+            (7, 0, 6),
+            (6, 0, 7),
+            (5, 0, 7),
+            (4, 0, 7),
+            (3, 0, 7),
             (2, 0, 6),
             (2, 0, 5),
             (2, 0, 4),
@@ -4291,41 +4292,41 @@ hexahedron_data: dict[int, ElementInfo] = {
             (0, 1, 4),
             (0, 1, 5),
             (0, 1, 6),
-            (0, 1, 6),
+            (0, 1, 7),
             (0, 2, 8),
             (0, 3, 8),
             (0, 4, 8),
             (0, 5, 8),
             (0, 6, 8),
-            (0, 6, 8),
-            (0, 8, 6),
+            (0, 7, 8),
+            (0, 8, 7),
             (0, 8, 6),
             (0, 8, 5),
             (0, 8, 4),
             (0, 8, 3),
             (0, 8, 2),
-            (0, 6, 1),
+            (0, 7, 1),
             (0, 6, 1),
             (0, 5, 1),
             (0, 4, 1),
             (0, 3, 1),
             (0, 2, 1),
             (0, 2, 2),
-            (0, 2, 6),
-            (0, 6, 6),
-            (0, 6, 2),
+            (0, 2, 7),
+            (0, 7, 7),
+            (0, 7, 2),
             (0, 2, 3),
             (0, 2, 4),
             (0, 2, 5),
             (0, 2, 6),
-            (0, 3, 6),
-            (0, 4, 6),
-            (0, 5, 6),
-            (0, 6, 6),
-            (0, 6, 6),
-            (0, 6, 5),
-            (0, 6, 4),
-            (0, 6, 3),
+            (0, 3, 7),
+            (0, 4, 7),
+            (0, 5, 7),
+            (0, 6, 7),
+            (0, 7, 6),
+            (0, 7, 5),
+            (0, 7, 4),
+            (0, 7, 3),
             (0, 6, 2),
             (0, 5, 2),
             (0, 4, 2),
@@ -4355,41 +4356,41 @@ hexahedron_data: dict[int, ElementInfo] = {
             (9, 4, 1),
             (9, 5, 1),
             (9, 6, 1),
-            (9, 6, 1),
+            (9, 7, 1),
             (9, 8, 2),
             (9, 8, 3),
             (9, 8, 4),
             (9, 8, 5),
             (9, 8, 6),
-            (9, 8, 6),
-            (9, 6, 8),
+            (9, 8, 7),
+            (9, 7, 8),
             (9, 6, 8),
             (9, 5, 8),
             (9, 4, 8),
             (9, 3, 8),
             (9, 2, 8),
-            (9, 1, 6),
+            (9, 1, 7),
             (9, 1, 6),
             (9, 1, 5),
             (9, 1, 4),
             (9, 1, 3),
             (9, 1, 2),
             (9, 2, 2),
-            (9, 6, 2),
-            (9, 6, 6),
-            (9, 2, 6),
+            (9, 7, 2),
+            (9, 7, 7),
+            (9, 2, 7),
             (9, 3, 2),
             (9, 4, 2),
             (9, 5, 2),
             (9, 6, 2),
-            (9, 6, 3),
-            (9, 6, 4),
-            (9, 6, 5),
-            (9, 6, 6),
-            (9, 6, 6),
-            (9, 5, 6),
-            (9, 4, 6),
-            (9, 3, 6),
+            (9, 7, 3),
+            (9, 7, 4),
+            (9, 7, 5),
+            (9, 7, 6),
+            (9, 6, 7),
+            (9, 5, 7),
+            (9, 4, 7),
+            (9, 3, 7),
             (9, 2, 6),
             (9, 2, 5),
             (9, 2, 4),
@@ -4414,7 +4415,7 @@ hexahedron_data: dict[int, ElementInfo] = {
             (1, 9, 1),
             (1, 9, 8),
             (8, 9, 8),
-            (6, 9, 1),
+            (7, 9, 1),
             (6, 9, 1),
             (5, 9, 1),
             (4, 9, 1),
@@ -4425,23 +4426,23 @@ hexahedron_data: dict[int, ElementInfo] = {
             (1, 9, 4),
             (1, 9, 5),
             (1, 9, 6),
-            (1, 9, 6),
+            (1, 9, 7),
             (2, 9, 8),
             (3, 9, 8),
             (4, 9, 8),
             (5, 9, 8),
             (6, 9, 8),
-            (6, 9, 8),
-            (8, 9, 6),
+            (7, 9, 8),
+            (8, 9, 7),
             (8, 9, 6),
             (8, 9, 5),
             (8, 9, 4),
             (8, 9, 3),
             (8, 9, 2),
-            (6, 9, 2),
+            (7, 9, 2),
             (2, 9, 2),
-            (2, 9, 6),
-            (6, 9, 6),
+            (2, 9, 7),
+            (7, 9, 7),
             (6, 9, 2),
             (5, 9, 2),
             (4, 9, 2),
@@ -4450,14 +4451,14 @@ hexahedron_data: dict[int, ElementInfo] = {
             (2, 9, 4),
             (2, 9, 5),
             (2, 9, 6),
-            (3, 9, 6),
-            (4, 9, 6),
-            (5, 9, 6),
-            (6, 9, 6),
-            (6, 9, 6),
-            (6, 9, 5),
-            (6, 9, 4),
-            (6, 9, 3),
+            (3, 9, 7),
+            (4, 9, 7),
+            (5, 9, 7),
+            (6, 9, 7),
+            (7, 9, 6),
+            (7, 9, 5),
+            (7, 9, 4),
+            (7, 9, 3),
             (6, 9, 3),
             (3, 9, 3),
             (3, 9, 6),
@@ -4483,41 +4484,41 @@ hexahedron_data: dict[int, ElementInfo] = {
             (4, 1, 9),
             (5, 1, 9),
             (6, 1, 9),
-            (6, 1, 9),
+            (7, 1, 9),
             (8, 2, 9),
             (8, 3, 9),
             (8, 4, 9),
             (8, 5, 9),
             (8, 6, 9),
-            (8, 6, 9),
-            (6, 8, 9),
+            (8, 7, 9),
+            (7, 8, 9),
             (6, 8, 9),
             (5, 8, 9),
             (4, 8, 9),
             (3, 8, 9),
             (2, 8, 9),
-            (1, 6, 9),
+            (1, 7, 9),
             (1, 6, 9),
             (1, 5, 9),
             (1, 4, 9),
             (1, 3, 9),
             (1, 2, 9),
             (2, 2, 9),
-            (6, 2, 9),
-            (6, 6, 9),
-            (2, 6, 9),
+            (7, 2, 9),
+            (7, 7, 9),
+            (2, 7, 9),
             (3, 2, 9),
             (4, 2, 9),
             (5, 2, 9),
             (6, 2, 9),
-            (6, 3, 9),
-            (6, 4, 9),
-            (6, 5, 9),
-            (6, 6, 9),
-            (6, 6, 9),
-            (5, 6, 9),
-            (4, 6, 9),
-            (3, 6, 9),
+            (7, 3, 9),
+            (7, 4, 9),
+            (7, 5, 9),
+            (7, 6, 9),
+            (6, 7, 9),
+            (5, 7, 9),
+            (4, 7, 9),
+            (3, 7, 9),
             (2, 6, 9),
             (2, 5, 9),
             (2, 4, 9),
@@ -4551,32 +4552,32 @@ hexahedron_data: dict[int, ElementInfo] = {
             (4, 1, 1),
             (5, 1, 1),
             (6, 1, 1),
-            (6, 1, 1),
+            (7, 1, 1),
             (1, 2, 1),
             (1, 3, 1),
             (1, 4, 1),
             (1, 5, 1),
             (1, 6, 1),
-            (1, 6, 1),
+            (1, 7, 1),
             (1, 1, 2),
             (1, 1, 3),
             (1, 1, 4),
             (1, 1, 5),
             (1, 1, 6),
-            (1, 1, 6),
+            (1, 1, 7),
             (8, 2, 1),
             (8, 3, 1),
             (8, 4, 1),
             (8, 5, 1),
             (8, 6, 1),
-            (8, 6, 1),
+            (8, 7, 1),
             (8, 1, 2),
             (8, 1, 3),
             (8, 1, 4),
             (8, 1, 5),
             (8, 1, 6),
-            (8, 1, 6),
-            (6, 8, 1),
+            (8, 1, 7),
+            (7, 8, 1),
             (6, 8, 1),
             (5, 8, 1),
             (4, 8, 1),
@@ -4587,53 +4588,53 @@ hexahedron_data: dict[int, ElementInfo] = {
             (8, 8, 4),
             (8, 8, 5),
             (8, 8, 6),
-            (8, 8, 6),
+            (8, 8, 7),
             (1, 8, 2),
             (1, 8, 3),
             (1, 8, 4),
             (1, 8, 5),
             (1, 8, 6),
-            (1, 8, 6),
+            (1, 8, 7),
             (2, 1, 8),
             (3, 1, 8),
             (4, 1, 8),
             (5, 1, 8),
             (6, 1, 8),
-            (6, 1, 8),
+            (7, 1, 8),
             (1, 2, 8),
             (1, 3, 8),
             (1, 4, 8),
             (1, 5, 8),
             (1, 6, 8),
-            (1, 6, 8),
+            (1, 7, 8),
             (8, 2, 8),
             (8, 3, 8),
             (8, 4, 8),
             (8, 5, 8),
             (8, 6, 8),
-            (8, 6, 8),
-            (6, 8, 8),
+            (8, 7, 8),
+            (7, 8, 8),
             (6, 8, 8),
             (5, 8, 8),
             (4, 8, 8),
             (3, 8, 8),
             (2, 8, 8),
             (2, 2, 1),
-            (2, 6, 1),
-            (6, 6, 1),
-            (6, 2, 1),
+            (2, 7, 1),
+            (7, 7, 1),
+            (7, 2, 1),
             (2, 3, 1),
             (2, 4, 1),
             (2, 5, 1),
             (2, 6, 1),
-            (3, 6, 1),
-            (4, 6, 1),
-            (5, 6, 1),
-            (6, 6, 1),
-            (6, 6, 1),
-            (6, 5, 1),
-            (6, 4, 1),
-            (6, 3, 1),
+            (3, 7, 1),
+            (4, 7, 1),
+            (5, 7, 1),
+            (6, 7, 1),
+            (7, 6, 1),
+            (7, 5, 1),
+            (7, 4, 1),
+            (7, 3, 1),
             (6, 2, 1),
             (5, 2, 1),
             (4, 2, 1),
@@ -4655,21 +4656,21 @@ hexahedron_data: dict[int, ElementInfo] = {
             (5, 5, 1),
             (5, 4, 1),
             (2, 1, 2),
-            (6, 1, 2),
-            (6, 1, 6),
-            (2, 1, 6),
-            (3, 1, 2),
+            (7, 1, 2),
+            (7, 1, 7),
+            (2, 1, 7),
+            (3, 1, 2),
             (4, 1, 2),
             (5, 1, 2),
             (6, 1, 2),
-            (6, 1, 3),
-            (6, 1, 4),
-            (6, 1, 5),
-            (6, 1, 6),
-            (6, 1, 6),
-            (5, 1, 6),
-            (4, 1, 6),
-            (3, 1, 6),
+            (7, 1, 3),
+            (7, 1, 4),
+            (7, 1, 5),
+            (7, 1, 6),
+            (6, 1, 7),
+            (5, 1, 7),
+            (4, 1, 7),
+            (3, 1, 7),
             (2, 1, 6),
             (2, 1, 5),
             (2, 1, 4),
@@ -4691,21 +4692,21 @@ hexahedron_data: dict[int, ElementInfo] = {
             (5, 1, 5),
             (4, 1, 5),
             (1, 2, 2),
-            (1, 2, 6),
-            (1, 6, 6),
-            (1, 6, 2),
+            (1, 2, 7),
+            (1, 7, 7),
+            (1, 7, 2),
             (1, 2, 3),
             (1, 2, 4),
             (1, 2, 5),
             (1, 2, 6),
-            (1, 3, 6),
-            (1, 4, 6),
-            (1, 5, 6),
-            (1, 6, 6),
-            (1, 6, 6),
-            (1, 6, 5),
-            (1, 6, 4),
-            (1, 6, 3),
+            (1, 3, 7),
+            (1, 4, 7),
+            (1, 5, 7),
+            (1, 6, 7),
+            (1, 7, 6),
+            (1, 7, 5),
+            (1, 7, 4),
+            (1, 7, 3),
             (1, 6, 2),
             (1, 5, 2),
             (1, 4, 2),
@@ -4727,21 +4728,21 @@ hexahedron_data: dict[int, ElementInfo] = {
             (1, 5, 5),
             (1, 5, 4),
             (8, 2, 2),
-            (8, 6, 2),
-            (8, 6, 6),
-            (8, 2, 6),
+            (8, 7, 2),
+            (8, 7, 7),
+            (8, 2, 7),
             (8, 3, 2),
             (8, 4, 2),
             (8, 5, 2),
             (8, 6, 2),
-            (8, 6, 3),
-            (8, 6, 4),
-            (8, 6, 5),
-            (8, 6, 6),
-            (8, 6, 6),
-            (8, 5, 6),
-            (8, 4, 6),
-            (8, 3, 6),
+            (8, 7, 3),
+            (8, 7, 4),
+            (8, 7, 5),
+            (8, 7, 6),
+            (8, 6, 7),
+            (8, 5, 7),
+            (8, 4, 7),
+            (8, 3, 7),
             (8, 2, 6),
             (8, 2, 5),
             (8, 2, 4),
@@ -4762,10 +4763,10 @@ hexahedron_data: dict[int, ElementInfo] = {
             (8, 5, 4),
             (8, 5, 5),
             (8, 4, 5),
-            (6, 8, 2),
+            (7, 8, 2),
             (2, 8, 2),
-            (2, 8, 6),
-            (6, 8, 6),
+            (2, 8, 7),
+            (7, 8, 7),
             (6, 8, 2),
             (5, 8, 2),
             (4, 8, 2),
@@ -4774,14 +4775,14 @@ hexahedron_data: dict[int, ElementInfo] = {
             (2, 8, 4),
             (2, 8, 5),
             (2, 8, 6),
-            (3, 8, 6),
-            (4, 8, 6),
-            (5, 8, 6),
-            (6, 8, 6),
-            (6, 8, 6),
-            (6, 8, 5),
-            (6, 8, 4),
-            (6, 8, 3),
+            (3, 8, 7),
+            (4, 8, 7),
+            (5, 8, 7),
+            (6, 8, 7),
+            (7, 8, 6),
+            (7, 8, 5),
+            (7, 8, 4),
+            (7, 8, 3),
             (6, 8, 3),
             (3, 8, 3),
             (3, 8, 6),
@@ -4799,21 +4800,21 @@ hexahedron_data: dict[int, ElementInfo] = {
             (4, 8, 5),
             (5, 8, 5),
             (2, 2, 8),
-            (6, 2, 8),
-            (6, 6, 8),
-            (2, 6, 8),
+            (7, 2, 8),
+            (7, 7, 8),
+            (2, 7, 8),
             (3, 2, 8),
             (4, 2, 8),
             (5, 2, 8),
             (6, 2, 8),
-            (6, 3, 8),
-            (6, 4, 8),
-            (6, 5, 8),
-            (6, 6, 8),
-            (6, 6, 8),
-            (5, 6, 8),
-            (4, 6, 8),
-            (3, 6, 8),
+            (7, 3, 8),
+            (7, 4, 8),
+            (7, 5, 8),
+            (7, 6, 8),
+            (6, 7, 8),
+            (5, 7, 8),
+            (4, 7, 8),
+            (3, 7, 8),
             (2, 6, 8),
             (2, 5, 8),
             (2, 4, 8),
@@ -4835,13 +4836,13 @@ hexahedron_data: dict[int, ElementInfo] = {
             (5, 5, 8),
             (4, 5, 8),
             (2, 2, 2),
-            (6, 2, 2),
-            (6, 6, 2),
-            (2, 6, 2),
-            (2, 2, 6),
-            (6, 2, 6),
-            (6, 6, 6),
-            (2, 6, 6),
+            (7, 2, 2),
+            (7, 7, 2),
+            (2, 7, 2),
+            (2, 2, 7),
+            (7, 2, 7),
+            (7, 7, 7),
+            (2, 7, 7),
             (3, 2, 2),
             (4, 2, 2),
             (5, 2, 2),
@@ -4854,42 +4855,42 @@ hexahedron_data: dict[int, ElementInfo] = {
             (2, 2, 4),
             (2, 2, 5),
             (2, 2, 6),
-            (6, 3, 2),
-            (6, 4, 2),
-            (6, 5, 2),
-            (6, 6, 2),
-            (6, 2, 3),
-            (6, 2, 4),
-            (6, 2, 5),
-            (6, 2, 6),
-            (6, 6, 2),
-            (5, 6, 2),
-            (4, 6, 2),
-            (3, 6, 2),
-            (6, 6, 3),
-            (6, 6, 4),
-            (6, 6, 5),
-            (6, 6, 6),
-            (2, 6, 3),
-            (2, 6, 4),
-            (2, 6, 5),
-            (2, 6, 6),
-            (3, 2, 6),
-            (4, 2, 6),
-            (5, 2, 6),
-            (6, 2, 6),
-            (2, 3, 6),
-            (2, 4, 6),
-            (2, 5, 6),
-            (2, 6, 6),
-            (6, 3, 6),
-            (6, 4, 6),
-            (6, 5, 6),
-            (6, 6, 6),
-            (6, 6, 6),
-            (5, 6, 6),
-            (4, 6, 6),
-            (3, 6, 6),
+            (7, 3, 2),
+            (7, 4, 2),
+            (7, 5, 2),
+            (7, 6, 2),
+            (7, 2, 3),
+            (7, 2, 4),
+            (7, 2, 5),
+            (7, 2, 6),
+            (6, 7, 2),
+            (5, 7, 2),
+            (4, 7, 2),
+            (3, 7, 2),
+            (7, 7, 3),
+            (7, 7, 4),
+            (7, 7, 5),
+            (7, 7, 6),
+            (2, 7, 3),
+            (2, 7, 4),
+            (2, 7, 5),
+            (2, 7, 6),
+            (3, 2, 7),
+            (4, 2, 7),
+            (5, 2, 7),
+            (6, 2, 7),
+            (2, 3, 7),
+            (2, 4, 7),
+            (2, 5, 7),
+            (2, 6, 7),
+            (7, 3, 7),
+            (7, 4, 7),
+            (7, 5, 7),
+            (7, 6, 7),
+            (6, 7, 7),
+            (5, 7, 7),
+            (4, 7, 7),
+            (3, 7, 7),
             (3, 3, 2),
             (3, 6, 2),
             (6, 6, 2),
@@ -4938,54 +4939,54 @@ hexahedron_data: dict[int, ElementInfo] = {
             (2, 4, 5),
             (2, 5, 5),
             (2, 5, 4),
-            (6, 3, 3),
-            (6, 6, 3),
-            (6, 6, 6),
-            (6, 3, 6),
-            (6, 4, 3),
-            (6, 5, 3),
-            (6, 6, 4),
-            (6, 6, 5),
-            (6, 5, 6),
-            (6, 4, 6),
-            (6, 3, 5),
-            (6, 3, 4),
-            (6, 4, 4),
-            (6, 5, 4),
-            (6, 5, 5),
-            (6, 4, 5),
-            (6, 6, 3),
-            (3, 6, 3),
-            (3, 6, 6),
-            (6, 6, 6),
-            (5, 6, 3),
-            (4, 6, 3),
-            (3, 6, 4),
-            (3, 6, 5),
-            (4, 6, 6),
-            (5, 6, 6),
-            (6, 6, 5),
-            (6, 6, 4),
-            (5, 6, 4),
-            (4, 6, 4),
-            (4, 6, 5),
-            (5, 6, 5),
-            (3, 3, 6),
-            (6, 3, 6),
-            (6, 6, 6),
-            (3, 6, 6),
-            (4, 3, 6),
-            (5, 3, 6),
-            (6, 4, 6),
-            (6, 5, 6),
-            (5, 6, 6),
-            (4, 6, 6),
-            (3, 5, 6),
-            (3, 4, 6),
-            (4, 4, 6),
-            (5, 4, 6),
-            (5, 5, 6),
-            (4, 5, 6),
+            (7, 3, 3),
+            (7, 6, 3),
+            (7, 6, 6),
+            (7, 3, 6),
+            (7, 4, 3),
+            (7, 5, 3),
+            (7, 6, 4),
+            (7, 6, 5),
+            (7, 5, 6),
+            (7, 4, 6),
+            (7, 3, 5),
+            (7, 3, 4),
+            (7, 4, 4),
+            (7, 5, 4),
+            (7, 5, 5),
+            (7, 4, 5),
+            (6, 7, 3),
+            (3, 7, 3),
+            (3, 7, 6),
+            (6, 7, 6),
+            (5, 7, 3),
+            (4, 7, 3),
+            (3, 7, 4),
+            (3, 7, 5),
+            (4, 7, 6),
+            (5, 7, 6),
+            (6, 7, 5),
+            (6, 7, 4),
+            (5, 7, 4),
+            (4, 7, 4),
+            (4, 7, 5),
+            (5, 7, 5),
+            (3, 3, 7),
+            (6, 3, 7),
+            (6, 6, 7),
+            (3, 6, 7),
+            (4, 3, 7),
+            (5, 3, 7),
+            (6, 4, 7),
+            (6, 5, 7),
+            (5, 6, 7),
+            (4, 6, 7),
+            (3, 5, 7),
+            (3, 4, 7),
+            (4, 4, 7),
+            (5, 4, 7),
+            (5, 5, 7),
+            (4, 5, 7),
             (3, 3, 3),
             (6, 3, 3),
             (6, 6, 3),
@@ -23,14 +23,15 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 """
 
+import re
 from abc import ABC, abstractmethod
-from collections.abc import Iterable, Iterator, MutableSequence, Sequence
-from typing import ClassVar, Literal
+from collections.abc import Callable, Iterable, Iterator, MutableSequence, Sequence
+from dataclasses import dataclass, field
+from functools import cache, lru_cache, wraps
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, TypeVar
 
 import numpy as np
 
-from pytools import memoize_method
-
 from gmsh_interop.runner import (  # noqa: F401
     FileSource,
     LiteralSource,
@@ -39,6 +40,10 @@ from gmsh_interop.runner import (  # noqa: F401
 )
 
 
+if TYPE_CHECKING:
+    from gmsh_interop.node_tuples import ElementInfo
+
+
 __doc__ = """
 .. exception:: GmshFileFormatError
 
@@ -82,6 +87,7 @@ Reader
 .. autoclass:: ScriptWithFilesSource
 
 .. autofunction:: read_gmsh
+.. autofunction:: read_gmsh_cached
 .. autofunction:: generate_gmsh
 
 """
@@ -110,41 +116,71 @@ def generate_triangle_volume_tuples(order: int) -> Iterator[tuple[int, int]]:
             yield (j, i)
 
 
-def generate_quad_vertex_tuples(dim: int, order: int) -> Iterator[tuple[int, ...]]:
+@cache
+def _quad_vertex_tuples(dim: int, order: int) -> tuple[tuple[int, ...], ...]:
     from pytools import generate_nonnegative_integer_tuples_below
 
-    for tup in generate_nonnegative_integer_tuples_below(2, dim):
-        yield tuple(order * i for i in tup)
+    return tuple(
+        tuple(order * i for i in tup)
+        for tup in generate_nonnegative_integer_tuples_below(2, dim))
 
 
-class LineFeeder:
-    def __init__(self, line_iterable: Iterable[str]) -> None:
-        self.line_iterable = iter(line_iterable)
-        self.next_line: str | None = None
+def generate_quad_vertex_tuples(dim: int, order: int) -> Iterator[tuple[int, ...]]:
+    yield from _quad_vertex_tuples(dim, order)
 
-    def has_next_line(self) -> bool:
-        if self.next_line is not None:
-            return True
 
-        try:
-            self.next_line = next(self.line_iterable)
-        except StopIteration:
-            return False
-        else:
-            return True
+class _LineCursor:
+    def __init__(self, lines: Sequence[str]) -> None:
+        self.lines = lines
+        self.index = 0
+
+    def has_next_line(self) -> bool:
+        return self.index < len(self.lines)
 
     def get_next_line(self) -> str:
-        if self.next_line is not None:
-            nl = self.next_line
-            self.next_line = None
-            return nl.strip()
+        if self.index >= len(self.lines):
+            raise GmshFileFormatError("Unexpected end of file")
 
-        try:
-            nl = next(self.line_iterable)
-        except StopIteration:
-            raise GmshFileFormatError("Unexpected end of file") from None
-        else:
-            return nl.strip()
+        self.index += 1
+        return self.lines[self.index - 1].strip()
+
+    def get_next_lines(self, count: int) -> Sequence[str]:
+        if self.index + count > len(self.lines):
+            raise GmshFileFormatError("Unexpected end of file")
+
+        self.index += count
+        return self.lines[self.index - count:self.index]
+
+
+ScalarT = TypeVar("ScalarT", bound=np.generic)
+
+_PHYSICAL_NAME_RE = re.compile(
+    r'^[ \t]*(\d+)[ \t]+(\d+)[ \t]+"(.*)"[ \t]*$', re.MULTILINE)
+
+
+def _parse_numeric_lines(
+        lines: Sequence[str],
+        dtype: type[ScalarT],
+        section_name: str) -> np.ndarray[tuple[int, ...], np.dtype[ScalarT]]:
+    if not lines:
+        return np.empty((0, 0), dtype=dtype)
+
+    # NOTE: np.loadtxt is implemented in C (numpy >= 1.23) and is at least as
+    # fast as np.fromstring(..., sep=" ") on the joined lines, but it also
+    # reports ragged or malformed lines instead of silently truncating.
+    try:
+        result = np.loadtxt(lines, dtype=dtype, ndmin=2, comments=None)
+    except ValueError as exc:
+        raise GmshFileFormatError(
+            f"Invalid line in ${section_name} section: {exc}") from exc
+
+    # NOTE: np.loadtxt silently skips blank lines
+    if result.shape[0] != len(lines):
+        raise GmshFileFormatError(
+            f"Blank line in ${section_name} section: expected {len(lines)} "
+            f"lines of entries, but found {result.shape[0]}")
+
+    return result
 
 # }}}
 
@@ -155,6 +191,42 @@ IndexArray = np.ndarray[tuple[int, ...], np.dtype[np.integer]]
 NodeTuples = Sequence[tuple[int, ...]]
 
 
+ElementT = TypeVar("ElementT", bound="GmshElementBase")
+ResultT = TypeVar("ResultT")
+
+
+def _memoize_per_element_class(
+        method: Callable[[ElementT], ResultT]) -> Callable[[ElementT], ResultT]:
+    """Like :func:`pytools.memoize_method`, but shares the cached values
+    between all instances of an element class with the same order.
+    """
+    results: dict[tuple[type, int], ResultT] = {}
+
+    @wraps(method)
+    def wrapper(self: ElementT) -> ResultT:
+        key = (type(self), self.order)
+        try:
+            return results[key]
+        except KeyError:
+            result = results[key] = method(self)
+            return result
+
+    return wrapper
+
+
+def _lattice_node_tuple_array(order: int, dim: int) -> IndexArray:
+    """Return all tuples with *dim* entries from ``0, ..., order`` as the rows
+    of an array, ordered such that the first entry varies fastest.
+    """
+    tuples = np.indices((order + 1,) * dim, dtype=np.intp).reshape(
+        dim, (order + 1) ** dim)
+
+    # np.indices varies the last axis fastest, so reverse the columns
+    result: IndexArray = tuples.T[:, ::-1]
+    return result
+
+
+@dataclass(frozen=True, slots=True)
 class GmshElementBase(ABC):
     """
     .. automethod:: vertex_count
@@ -166,20 +238,31 @@ class GmshElementBase(ABC):
         of the element. The tuples constituents are non-negative integers
         whose sum is less than or equal to the order of the element.
 
+    .. automethod:: lexicographic_node_tuple_array
+
+        Return the :meth:`lexicographic_node_tuples` as the rows of an
+        integer array of shape ``(node_count, dimensions)``.
+
     .. automethod:: get_lexicographic_gmsh_node_indices
+
+    .. attribute:: order
+    .. attribute:: dimensions
+    .. attribute:: element_type
+
+        The Gmsh element type number, determined by the element class and
+        its order.
     """
 
-    def __init__(self, order: int) -> None:
-        self.order = order
+    dimensions: ClassVar[int]
 
-    @property
-    @abstractmethod
-    def dimensions(self) -> int:
-        pass
+    order: int
+    element_type: int = field(init=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "element_type", self._compute_element_type())
 
-    @property
     @abstractmethod
-    def element_type(self) -> int:
+    def _compute_element_type(self) -> int:
         pass
 
     @abstractmethod
@@ -195,87 +278,87 @@ class GmshElementBase(ABC):
         pass
 
     @abstractmethod
-    def lexicographic_node_tuples(self) -> NodeTuples:
+    def lexicographic_node_tuple_array(self) -> IndexArray:
         pass
 
-    @memoize_method
+    @_memoize_per_element_class
+    def lexicographic_node_tuples(self) -> NodeTuples:
+        return list(map(tuple, self.lexicographic_node_tuple_array().tolist()))
+
+    @_memoize_per_element_class
     def get_lexicographic_gmsh_node_indices(self) -> IndexArray:
-        gmsh_tup_to_index = {
-            tup: i for i, tup in enumerate(self.gmsh_node_tuples())
-        }
+        # encode each node tuple as a single integer in base (order + 1)
+        weights = (self.order + 1) ** np.arange(self.dimensions, dtype=np.intp)
+        gmsh_codes = np.array(self.gmsh_node_tuples(), dtype=np.intp) @ weights
+        lex_codes = self.lexicographic_node_tuple_array() @ weights
 
-        return np.array([
-            gmsh_tup_to_index[tup] for tup in self.lexicographic_node_tuples()],
-            dtype=np.intp)
+        gmsh_sorted = np.argsort(gmsh_codes)
+        result = gmsh_sorted[np.minimum(
+            np.searchsorted(gmsh_codes, lex_codes, sorter=gmsh_sorted),
+            len(gmsh_codes) - 1)]
+
+        if not np.array_equal(gmsh_codes[result], lex_codes):
+            raise ValueError(
+                f"{type(self).__name__}: not all lexicographic node tuples "
+                "are present in the gmsh node tuples")
+
+        return result
 
 
 # {{{ simplices
 
+@dataclass(frozen=True, slots=True)
 class GmshSimplexElementBase(GmshElementBase):
     def vertex_count(self) -> int:
         return self.dimensions + 1
 
-    @memoize_method
     def node_count(self) -> int:
         """Return the number of interpolation nodes in this element."""
-        import math
-        from functools import reduce
-        from operator import mul
-        return (
-                reduce(mul, (self.order + 1 + i for i in range(self.dimensions)), 1)
-                // math.factorial(self.dimensions))
-
-    @memoize_method
-    def lexicographic_node_tuples(self) -> NodeTuples:
-        from pytools import (
-            generate_nonnegative_integer_tuples_summing_to_at_most as gnitstam,
-        )
-        result = list(gnitstam(self.order, self.dimensions))
+        from math import comb
+        return comb(self.order + self.dimensions, self.dimensions)
+
+    @_memoize_per_element_class
+    def lexicographic_node_tuple_array(self) -> IndexArray:
+        # same ordering as pytools' gnitstam
+        tuples = _lattice_node_tuple_array(self.order, self.dimensions)
+        result: IndexArray = tuples[tuples.sum(axis=1) <= self.order]
 
         assert len(result) == self.node_count()
         return result
 
 
+@dataclass(frozen=True, slots=True)
 class GmshPoint(GmshSimplexElementBase):
-    @property
-    def dimensions(self) -> int:
-        return 0
+    dimensions: ClassVar[int] = 0
 
-    @property
-    def element_type(self) -> int:
+    def _compute_element_type(self) -> int:
         return 15
 
-    @memoize_method
+    @_memoize_per_element_class
     def gmsh_node_tuples(self) -> NodeTuples:
         return [()]
 
 
+@dataclass(frozen=True, slots=True)
 class GmshIntervalElement(GmshSimplexElementBase):
-    @property
-    def dimensions(self) -> int:
-        return 1
+    dimensions: ClassVar[int] = 1
 
-    @property
-    @memoize_method
-    def element_type(self) -> int:
+    def _compute_element_type(self) -> int:
         return [1, 8, 26, 27, 28, 62, 63, 64, 65, 66][self.order - 1]
 
-    @memoize_method
+    @_memoize_per_element_class
     def gmsh_node_tuples(self) -> NodeTuples:
         return [(0,), (self.order,), ] + [(i,) for i in range(1, self.order)]
 
 
+@dataclass(frozen=True, slots=True)
 class GmshIncompleteTriangularElement(GmshSimplexElementBase):
-    @property
-    def dimensions(self) -> int:
-        return 2
+    dimensions: ClassVar[int] = 2
 
-    @property
-    @memoize_method
-    def element_type(self) -> int:
+    def _compute_element_type(self) -> int:
         return {3: 20, 4: 22, 5: 24}[self.order]
 
-    @memoize_method
+    @_memoize_per_element_class
     def gmsh_node_tuples(self) -> NodeTuples:
         result = []
         for tup in generate_triangle_vertex_tuples(self.order):
@@ -285,103 +368,91 @@ class GmshIncompleteTriangularElement(GmshSimplexElementBase):
         return result
 
 
+@dataclass(frozen=True, slots=True)
 class GmshTriangularElement(GmshSimplexElementBase):
-    @property
-    def dimensions(self) -> int:
-        return 2
+    dimensions: ClassVar[int] = 2
 
-    @property
-    @memoize_method
-    def element_type(self) -> int:
+    def _info(self) -> "ElementInfo":
         from gmsh_interop.node_tuples import triangle_data
-        return triangle_data[self.order]["element_type"]
+        return triangle_data[self.order]
 
-    @memoize_method
+    def _compute_element_type(self) -> int:
+        return self._info()["element_type"]
+
+    @_memoize_per_element_class
     def gmsh_node_tuples(self) -> NodeTuples:
-        from gmsh_interop.node_tuples import triangle_data
-        return triangle_data[self.order]["node_tuples"]
+        return self._info()["node_tuples"]
 
 
+@dataclass(frozen=True, slots=True)
 class GmshTetrahedralElement(GmshSimplexElementBase):
-    @property
-    def dimensions(self) -> int:
-        return 3
+    dimensions: ClassVar[int] = 3
 
-    @property
-    @memoize_method
-    def element_type(self) -> int:
+    def _info(self) -> "ElementInfo":
         from gmsh_interop.node_tuples import tetrahedron_data
-        return tetrahedron_data[self.order]["element_type"]
+        return tetrahedron_data[self.order]
+
+    def _compute_element_type(self) -> int:
+        return self._info()["element_type"]
 
-    @memoize_method
+    @_memoize_per_element_class
     def gmsh_node_tuples(self) -> NodeTuples:
-        from gmsh_interop.node_tuples import tetrahedron_data
-        return tetrahedron_data[self.order]["node_tuples"]
+        return self._info()["node_tuples"]
 
 # }}}
 
 
 # {{{ tensor product elements
 
+@dataclass(frozen=True, slots=True)
 class GmshTensorProductElementBase(GmshElementBase):
     def vertex_count(self) -> int:
         return int(2**self.dimensions)
 
-    @memoize_method
     def node_count(self) -> int:
         return int((self.order+1) ** self.dimensions)
 
-    @memoize_method
-    def lexicographic_node_tuples(self) -> NodeTuples:
-        """Generate tuples enumerating the node indices present in this element.
-
-        Each tuple has a length equal to the dimension of the element. The
-        tuples constituents are non-negative integers whose sum is less than or
-        equal to the order of the element.
-        """
-        from pytools import generate_nonnegative_integer_tuples_below as gnitb
-
-        # gnitb(2, 2) gives [(0, 0), (0, 1), (1, 0), (1, 1)]
-        # We want the x-coordinate to increase first, so reverse.
+    @_memoize_per_element_class
+    def lexicographic_node_tuple_array(self) -> IndexArray:
+        # We want the x-coordinate to increase first.
         # (This is also consistent with gnitstam.)
-        result = [tup[::-1] for tup in gnitb(self.order + 1, self.dimensions)]
+        result = np.ascontiguousarray(
+            _lattice_node_tuple_array(self.order, self.dimensions))
 
         assert len(result) == self.node_count()
         return result
 
 
+@dataclass(frozen=True, slots=True)
 class GmshQuadrilateralElement(GmshTensorProductElementBase):
-    @property
-    def dimensions(self) -> int:
-        return 2
+    dimensions: ClassVar[int] = 2
 
-    @property
-    @memoize_method
-    def element_type(self) -> int:
+    def _info(self) -> "ElementInfo":
         from gmsh_interop.node_tuples import quadrangle_data
-        return quadrangle_data[self.order]["element_type"]
+        return quadrangle_data[self.order]
+
+    def _compute_element_type(self) -> int:
+        return self._info()["element_type"]
 
-    @memoize_method
+    @_memoize_per_element_class
     def gmsh_node_tuples(self) -> NodeTuples:
-        from gmsh_interop.node_tuples import quadrangle_data
-        return quadrangle_data[self.order]["node_tuples"]
+        return self._info()["node_tuples"]
 
 
+@dataclass(frozen=True, slots=True)
 class GmshHexahedralElement(GmshTensorProductElementBase):
-    @property
-    def dimensions(self) -> int:
-        return 3
+    dimensions: ClassVar[int] = 3
 
-    @property
-    @memoize_method
-    def element_type(self) -> int:
+    def _info(self) -> "ElementInfo":
         from gmsh_interop.node_tuples import hexahedron_data
-        return hexahedron_data[self.order]["element_type"]
+        return hexahedron_data[self.order]
+
+    def _compute_element_type(self) -> int:
+        return self._info()["element_type"]
 
-    @memoize_method
+    @_memoize_per_element_class
     def gmsh_node_tuples(self) -> NodeTuples:
-        from gmsh_interop.node_tuples import hexahedron_data
-        return hexahedron_data[self.order]["node_tuples"]
+        return self._info()["node_tuples"]
 
 # }}}
 
@@ -392,8 +463,10 @@ class GmshHexahedralElement(GmshTensorProductElementBase):
 
 Point = np.ndarray[tuple[int, ...], np.dtype[np.floating]]
 Nodes = np.ndarray[tuple[int, ...], np.dtype[np.floating]]
+ObjectArray = np.ndarray[tuple[int, ...], np.dtype[np.object_]]
 
 
+@cache
 def _gmsh_supported_element_type_map() -> dict[int, GmshElementBase]:
     supported_elements = (
             [GmshPoint(0)]
@@ -408,22 +481,40 @@ def _gmsh_supported_element_type_map() -> dict[int, GmshElementBase]:
     return {el.element_type: el for el in supported_elements}
 
 
+class _SupportedElementTypeMapDescriptor:
+    """Constructs the map of supported element types on first access, so
+    that importing this module does not instantiate every element type.
+    """
+
+    def __get__(self,
+                obj: object | None,
+                objtype: type | None = None) -> dict[int, GmshElementBase]:
+        return _gmsh_supported_element_type_map()
+
+
 class GmshMeshReceiverBase:
     """
     .. autoattribute:: gmsh_element_type_to_info_map
+    .. attribute:: wants_lexicographic_nodes
+
+        If *False*, the reader does not compute the lexicographic node
+        ordering of each element and passes *None* as *lexicographic_nodes*
+        to :meth:`add_element` and :meth:`add_elements`. Defaults to *True*.
 
     .. automethod:: set_up_nodes
     .. automethod:: add_node
+    .. automethod:: add_nodes
     .. automethod:: finalize_nodes
     .. automethod:: set_up_elements
     .. automethod:: add_element
+    .. automethod:: add_elements
     .. automethod:: finalize_elements
     .. automethod:: add_tag
     .. automethod:: finalize_tags
     """
 
-    gmsh_element_type_to_info_map: ClassVar[dict[int, GmshElementBase]] = (
-        _gmsh_supported_element_type_map())
+    gmsh_element_type_to_info_map = _SupportedElementTypeMapDescriptor()
+    wants_lexicographic_nodes: ClassVar[bool] = True
 
     def set_up_nodes(self, count: int) -> None:
         pass
@@ -431,6 +522,14 @@ class GmshMeshReceiverBase:
     def add_node(self, node_nr: int, point: Point) -> None:
         pass
 
+    def add_nodes(self, node_nrs: IndexArray, points: Nodes) -> None:
+        """Add a batch of nodes, where *points* has one row per entry
+        of *node_nrs*. The default implementation calls :meth:`add_node`
+        for each node.
+        """
+        for node_nr, point in zip(node_nrs, points, strict=True):
+            self.add_node(int(node_nr), point)
+
     def finalize_nodes(self) -> None:
         pass
 
@@ -441,10 +540,30 @@ class GmshMeshReceiverBase:
                     element_nr: int,
                     element_type: GmshElementBase,
                     vertex_nrs: IndexArray,
-                    lexicographic_nodes: Nodes,
+                    lexicographic_nodes: Nodes | None,
                     tag_numbers: Sequence[int]) -> None:
         pass
 
+    def add_elements(self,
+                     element_nrs: IndexArray,
+                     element_type: GmshElementBase,
+                     vertex_nrs: IndexArray,
+                     lexicographic_nodes: IndexArray | None,
+                     tag_numbers: Sequence[Sequence[int]]) -> None:
+        """Add a batch of elements of the same *element_type*, where
+        *vertex_nrs* and *lexicographic_nodes* have one row per entry of
+        *element_nrs*. The default implementation calls :meth:`add_element`
+        for each element.
+        """
+        for i, element_nr in enumerate(element_nrs):
+            self.add_element(int(element_nr),
+                             element_type=element_type,
+                             vertex_nrs=vertex_nrs[i],
+                             lexicographic_nodes=(
+                                 None if lexicographic_nodes is None
+                                 else lexicographic_nodes[i]),
+                             tag_numbers=tag_numbers[i])
+
     def finalize_elements(self) -> None:
         pass
 
@@ -469,60 +588,182 @@ class GmshMeshReceiverNumPy(GmshMeshReceiverBase):
     via parsing text -- use :mod:`numpy` arrays as the base array data structure
     for convenience.
 
+    .. attribute:: points
+
+        A ``(node_count, ambient_dim)`` array of node coordinates.
+
+    .. attribute:: element_vertex_nrs
+
+        A ``(element_count, max_vertex_count)`` array of the vertex numbers of
+        each element, padded with -1.
+
+    .. attribute:: element_type_numbers
+
+        The Gmsh element type number of each element.
+
+    .. autoattribute:: elements
+    .. autoattribute:: element_types
+
     .. versionadded:: 2014.1
     """
 
+    # the lexicographic node information is not stored
+    wants_lexicographic_nodes: ClassVar[bool] = False
+
     def __init__(self) -> None:
         # Use data fields similar to meshpy.triangle.MeshInfo and meshpy.tet.MeshInfo
-        self.points: MutableSequence[Point | None] | None = None
-        self.elements: MutableSequence[IndexArray | None] | None = None
-        self.element_types: MutableSequence[GmshElementBase | None] | None = None
-        self.element_markers: MutableSequence[Sequence[int] | None] | None = None
+        self.points: Nodes | None = None
+        self.element_vertex_nrs: IndexArray | None = None
+        self.element_type_numbers: IndexArray | None = None
+        self.element_markers: ObjectArray | None = None
+        self._elements: ObjectArray | None = None
+        self._element_types: ObjectArray | None = None
         self.tags: MutableSequence[tuple[str, int, int]] | None = None
 
+        self._node_count = 0
+
     # Gmsh has no explicit concept of facets or faces; certain faces are a type
     # of element.  Consequently, there are no face markers, but elements can be
     # grouped together in physical groups that serve as markers.
 
     def set_up_nodes(self, count: int) -> None:
-        # Preallocate array of nodes within list; treat None as sentinel value.
-        # Preallocation not done for performance, but to assign values at indices
-        # in random order.
-        self.points = [None] * count
+        # The points are stored in a single (count, ambient_dim) array. The
+        # ambient dimension is only known once the first point arrives, so
+        # the array is allocated then.
+        self.points = None
+        self._node_count = count
+
+    def _get_points(self, ambient_dim: int) -> Nodes:
+        if self.points is None:
+            self.points = np.empty((self._node_count, ambient_dim))
+
+        return self.points
 
     def add_node(self, node_nr: int, point: Point) -> None:
-        assert self.points is not None
-        self.points[node_nr] = point
+        self._get_points(len(point))[node_nr] = point
+
+    def add_nodes(self, node_nrs: IndexArray, points: Nodes) -> None:
+        self._get_points(points.shape[1])[node_nrs] = points
 
     def finalize_nodes(self) -> None:
-        pass
+        if self.points is None:
+            self.points = np.empty((self._node_count, 3))
 
     def set_up_elements(self, count: int) -> None:
         # Preallocation of arrays for assignment elements in random order.
-        self.elements = [None] * count
-        self.element_types = [None] * count
-        self.element_markers = [None] * count
-        self.tags = []
+        # Elements of different types have different numbers of vertices, so
+        # the vertex numbers are padded with -1 up to the largest vertex
+        # count, and unassigned elements have a type number of -1.
+        max_vertex_count = max(
+            el.vertex_count() for el in self.gmsh_element_type_to_info_map.values())
+        self.element_vertex_nrs = np.full(
+            (count, max_vertex_count), -1, dtype=np.intp)
+        self.element_type_numbers = np.full(count, -1, dtype=np.int32)
+        self.element_markers = np.full(count, None, dtype=object)
+        self._elements = None
+        self._element_types = None
+        if self.tags is None:
+            self.tags = []
 
     def add_element(self,
                     element_nr: int,
                     element_type: GmshElementBase,
                     vertex_nrs: IndexArray,
-                    lexicographic_nodes: Nodes,
+                    lexicographic_nodes: Nodes | None,
                     tag_numbers: Sequence[int]) -> None:
-        assert self.elements is not None
-        self.elements[element_nr] = vertex_nrs
-        assert self.element_types is not None
-        self.element_types[element_nr] = element_type
+        assert self.element_vertex_nrs is not None
+        self.element_vertex_nrs[element_nr, :len(vertex_nrs)] = vertex_nrs
+        assert self.element_type_numbers is not None
+        self.element_type_numbers[element_nr] = element_type.element_type
         assert self.element_markers is not None
         self.element_markers[element_nr] = tag_numbers
+        self._elements = None
+        self._element_types = None
         # TODO: Add lexicographic node information
 
+    def add_elements(self,
+                     element_nrs: IndexArray,
+                     element_type: GmshElementBase,
+                     vertex_nrs: IndexArray,
+                     lexicographic_nodes: IndexArray | None,
+                     tag_numbers: Sequence[Sequence[int]]) -> None:
+        assert self.element_vertex_nrs is not None
+        assert self.element_type_numbers is not None
+        assert self.element_markers is not None
+
+        self.element_vertex_nrs[element_nrs, :vertex_nrs.shape[1]] = vertex_nrs
+        self.element_type_numbers[element_nrs] = element_type.element_type
+        for element_nr, element_tags in zip(
+                element_nrs.tolist(), tag_numbers, strict=True):
+            self.element_markers[element_nr] = element_tags
+
+        self._elements = None
+        self._element_types = None
+
     def finalize_elements(self) -> None:
         pass
 
+    @property
+    def elements(self) -> ObjectArray | None:
+        """An object array of the vertex numbers of each element, or *None*
+        for unassigned elements. The entries are views into
+        :attr:`element_vertex_nrs`. The array is only built on first access
+        and then kept until more elements are added.
+        """
+        if self._elements is None and self.element_vertex_nrs is not None:
+            assert self.element_type_numbers is not None
+
+            info_map = self.gmsh_element_type_to_info_map
+            elements = np.full(len(self.element_type_numbers), None, dtype=object)
+            for type_number in np.unique(self.element_type_numbers):
+                if type_number < 0:
+                    continue
+
+                element_type = info_map[int(type_number)]
+                element_nrs = np.flatnonzero(self.element_type_numbers == type_number)
+                vertex_nrs = self.element_vertex_nrs[
+                    element_nrs, :element_type.vertex_count()]
+                for element_nr, element_vertex_nrs in zip(
+                        element_nrs.tolist(), vertex_nrs, strict=True):
+                    elements[element_nr] = element_vertex_nrs
+
+            self._elements = elements
+
+        return self._elements
+
+    @elements.setter
+    def elements(self, value: ObjectArray | None) -> None:
+        self._elements = value
+
+    @property
+    def element_types(self) -> ObjectArray | None:
+        """An object array of the :class:`GmshElementBase` of each element,
+        or *None* for unassigned elements. Like :attr:`elements`, this is
+        built from :attr:`element_type_numbers` on first access.
+        """
+        if self._element_types is None and self.element_type_numbers is not None:
+            info_map = self.gmsh_element_type_to_info_map
+            element_types = np.full(
+                len(self.element_type_numbers), None, dtype=object)
+            for type_number in np.unique(self.element_type_numbers):
+                if type_number < 0:
+                    continue
+
+                element_types[self.element_type_numbers == type_number] = (
+                    info_map[int(type_number)])
+
+            self._element_types = element_types
+
+        return self._element_types
+
+    @element_types.setter
+    def element_types(self, value: ObjectArray | None) -> None:
+        self._element_types = value
+
     def add_tag(self, name: str, index: int, dimension: int) -> None:
-        assert self.tags is not None
+        # $PhysicalNames usually precedes $Elements
+        if self.tags is None:
+            self.tags = []
         self.tags.append((name, index, dimension))
 
     def finalize_tags(self) -> None:
@@ -548,7 +789,110 @@ def read_gmsh(
         this many dimensions.
     """
     with open(filename) as mesh_file:
-        parse_gmsh(receiver, mesh_file, force_dimension=force_dimension)
+        lines = mesh_file.read().splitlines()
+
+    parse_gmsh(receiver, lines, force_dimension=force_dimension)
+
+
+class _RecordingMeshReceiver(GmshMeshReceiverBase):
+    """Records the calls made by :func:`parse_gmsh` so that they can be
+    replayed onto another receiver by :func:`read_gmsh_cached`. Only the
+    bulk :meth:`add_nodes` and :meth:`add_elements` are recorded, since
+    :func:`parse_gmsh` does not call their per-item counterparts.
+    """
+
+    def __init__(self,
+                 element_type_to_info_map: dict[int, GmshElementBase]) -> None:
+        self.gmsh_element_type_to_info_map = element_type_to_info_map
+        self.calls: list[tuple[str, tuple[Any, ...]]] = []
+
+    def _record(self, name: str, *args: Any) -> None:
+        # recorded arrays are shared between all replays
+        for arg in args:
+            if isinstance(arg, np.ndarray):
+                arg.setflags(write=False)
+
+        self.calls.append((name, args))
+
+    def set_up_nodes(self, count: int) -> None:
+        self._record("set_up_nodes", count)
+
+    def add_nodes(self, node_nrs: IndexArray, points: Nodes) -> None:
+        self._record("add_nodes", node_nrs, points)
+
+    def finalize_nodes(self) -> None:
+        self._record("finalize_nodes")
+
+    def set_up_elements(self, count: int) -> None:
+        self._record("set_up_elements", count)
+
+    def add_elements(self,
+                     element_nrs: IndexArray,
+                     element_type: GmshElementBase,
+                     vertex_nrs: IndexArray,
+                     lexicographic_nodes: IndexArray | None,
+                     tag_numbers: Sequence[Sequence[int]]) -> None:
+        # tags are stored as tuples, since they are shared between all replays
+        self._record("add_elements", element_nrs, element_type,
+                     vertex_nrs, lexicographic_nodes,
+                     tuple(tuple(tags) for tags in tag_numbers))
+
+    def finalize_elements(self) -> None:
+        self._record("finalize_elements")
+
+    def add_tag(self, name: str, index: int, dimension: int) -> None:
+        self._record("add_tag", name, index, dimension)
+
+    def finalize_tags(self) -> None:
+        self._record("finalize_tags")
+
+
+class _NonLexicographicRecordingMeshReceiver(_RecordingMeshReceiver):
+    wants_lexicographic_nodes: ClassVar[bool] = False
+
+
+@lru_cache(maxsize=8)
+def _read_gmsh_calls(
+        filename: str,
+        mtime_ns: int,
+        size: int,
+        force_dimension: int | None,
+        element_type_to_info_map: tuple[tuple[int, GmshElementBase], ...],
+        wants_lexicographic_nodes: bool,
+        ) -> tuple[tuple[str, tuple[Any, ...]], ...]:
+    recorder_class = (
+        _RecordingMeshReceiver if wants_lexicographic_nodes
+        else _NonLexicographicRecordingMeshReceiver)
+    recorder = recorder_class(dict(element_type_to_info_map))
+    read_gmsh(recorder, filename, force_dimension=force_dimension)
+
+    return tuple(recorder.calls)
+
+
+def read_gmsh_cached(
+        receiver: GmshMeshReceiverBase,
+        filename: str,
+        force_dimension: int | None = None) -> None:
+    """Like :func:`read_gmsh`, but caches the parsed contents of the file.
+
+    Reading the same file again, as long as its modification time and size
+    are unchanged, replays the cached calls onto *receiver* without parsing.
+    The cache also depends on the
+    :attr:`~GmshMeshReceiverBase.gmsh_element_type_to_info_map` and
+    :attr:`~GmshMeshReceiverBase.wants_lexicographic_nodes` of *receiver*.
+    The arrays passed to *receiver* are shared between all reads of the same
+    file and are marked read-only, and tag numbers are passed as tuples.
+    """
+    import os
+
+    filename = os.path.abspath(filename)
+    stat = os.stat(filename)
+
+    for name, args in _read_gmsh_calls(
+            filename, stat.st_mtime_ns, stat.st_size, force_dimension,
+            tuple(sorted(receiver.gmsh_element_type_to_info_map.items())),
+            receiver.wants_lexicographic_nodes):
+        getattr(receiver, name)(*args)
 
 
 def generate_gmsh(
@@ -593,10 +937,20 @@ def parse_gmsh(receiver: GmshMeshReceiverBase,
         reading the GMSH file. See :class:`GmshMeshReceiverBase` for the
         interface this object needs to conform to.
     :arg line_iterable: an iterable that generates the lines of the GMSH file.
+        This may also be an open file, which is then read in a single call.
     :arg force_dimension: if not *None*, truncate point coordinates to this
         many dimensions.
     """
-    feeder = LineFeeder(line_iterable)
+    lines: Sequence[str]
+    read = getattr(line_iterable, "read", None)
+    if read is not None:
+        lines = read().splitlines()
+    elif isinstance(line_iterable, Sequence):
+        lines = line_iterable
+    else:
+        lines = list(line_iterable)
+
+    feeder = _LineCursor(lines)
 
     # collect the mesh information
 
@@ -644,40 +998,36 @@ def parse_gmsh(receiver: GmshMeshReceiverBase,
             node_count = int(feeder.get_next_line())
             receiver.set_up_nodes(node_count)
 
-            node_idx = 1
-
-            while True:
-                next_line = feeder.get_next_line()
-                if next_line == f"$End{section_name}":
-                    break
-
-                node_parts = next_line.split()
-                if len(node_parts) != 4:
-                    raise GmshFileFormatError(
-                        "Expected four-component line in $Nodes section: "
-                        f"got {node_parts} nodes")
-
-                read_node_idx = int(node_parts[0])
-                if read_node_idx != node_idx:
-                    raise GmshFileFormatError(
-                        f"Out-of-order node index found: got node {read_node_idx} "
-                        f"but expected node {node_idx}")
-
-                if force_dimension is not None:
-                    point = [float(x) for x in node_parts[1:force_dimension+1]]
-                else:
-                    point = [float(x) for x in node_parts[1:]]
+            nodes = _parse_numeric_lines(
+                feeder.get_next_lines(node_count), np.float64, section_name)
+            if node_count and nodes.shape != (node_count, 4):
+                raise GmshFileFormatError(
+                    f"Expected {node_count} four-component lines in $Nodes "
+                    f"section: got {nodes.shape[0]} lines with "
+                    f"{nodes.shape[1]} components")
+            nodes = nodes.reshape(node_count, 4)
+
+            node_nrs = nodes[:, 0].astype(np.intp)
+            expected_node_nrs = np.arange(1, node_count + 1, dtype=np.intp)
+            if not np.array_equal(node_nrs, expected_node_nrs):
+                idx = np.flatnonzero(node_nrs != expected_node_nrs)[0]
+                raise GmshFileFormatError(
+                    f"Out-of-order node index found: got node {node_nrs[idx]} "
+                    f"but expected node {expected_node_nrs[idx]}")
 
-                receiver.add_node(
-                        node_idx-1,
-                        np.array(point, dtype=np.float64))
+            # NOTE: these are views, each row of which is still contiguous
+            if force_dimension is not None:
+                points = nodes[:, 1:force_dimension+1]
+            else:
+                points = nodes[:, 1:]
 
-                node_idx += 1
+            receiver.add_nodes(node_nrs - 1, points)
 
-            if node_count+1 != node_idx:
+            next_line = feeder.get_next_line()
+            if next_line != f"$End{section_name}":
                 raise GmshFileFormatError(
-                    f"Unexpected number of nodes found: got {node_idx} nodes "
-                    f"but expected {node_count + 1} nodes")
+                    f"Unexpected number of nodes found: expected {node_count} "
+                    f"nodes, but found '{next_line}' after them")
 
             receiver.finalize_nodes()
 
@@ -685,26 +1035,23 @@ def parse_gmsh(receiver: GmshMeshReceiverBase,
             element_count = int(feeder.get_next_line())
             receiver.set_up_elements(element_count)
 
-            element_idx = 1
-            while True:
-                next_line = feeder.get_next_line()
-                if next_line == f"$End{section_name}":
-                    break
-
-                elem_parts = [int(x) for x in next_line.split()]
+            element_lines = feeder.get_next_lines(element_count)
 
+            # NOTE: the element type and the number of tags determine the
+            # number of entries in a line, so group lines by them and parse
+            # each group in bulk
+            groups: dict[tuple[int, int], list[int]] = {}
+            for i, line in enumerate(element_lines):
+                elem_parts = line.split(None, 3)
                 if len(elem_parts) < 4:
                     raise GmshFileFormatError(
                         f"Too few entries in element line: got {elem_parts} "
                         "but expected a list of at least 4 entries")
 
-                read_element_idx = elem_parts[0]
-                if read_element_idx != element_idx:
-                    raise GmshFileFormatError(
-                        "Out-of-order element index found: got element "
-                        f"{read_element_idx} but expected element {element_idx}")
+                key = (int(elem_parts[1]), int(elem_parts[2]))
+                groups.setdefault(key, []).append(i)
 
-                el_type_num = elem_parts[1]
+            for (el_type_num, tag_count), group in groups.items():
                 try:
                     element_type = receiver.gmsh_element_type_to_info_map[el_type_num]
                 except KeyError:
@@ -712,64 +1059,81 @@ def parse_gmsh(receiver: GmshMeshReceiverBase,
                             f"Unexpected element type: {el_type_num}"
                             ) from None
 
-                tag_count = elem_parts[2]
-                tags = elem_parts[3:3+tag_count]
+                elements = _parse_numeric_lines(
+                    [element_lines[i] for i in group], np.intp, section_name)
+
+                element_nrs = np.array(group, dtype=np.intp)
+                if not np.array_equal(elements[:, 0], element_nrs + 1):
+                    idx = np.flatnonzero(elements[:, 0] != element_nrs + 1)[0]
+                    raise GmshFileFormatError(
+                        "Out-of-order element index found: got element "
+                        f"{elements[idx, 0]} but expected element "
+                        f"{element_nrs[idx] + 1}")
 
-                # convert to zero-based
-                node_indices = np.array(
-                        [x-1 for x in elem_parts[3+tag_count:]], dtype=np.intp)
+                # convert to zero-based in place, the parsed block is not
+                # otherwise retained
+                node_indices = elements[:, 3+tag_count:]
+                node_indices -= 1
 
-                if element_type.node_count() != len(node_indices):
+                if element_type.node_count() != node_indices.shape[1]:
                     raise GmshFileFormatError(
                         "Unexpected number of nodes in element: got "
-                        f"{len(node_indices)} nodes but expected "
+                        f"{node_indices.shape[1]} nodes but expected "
                         f"{element_type.node_count()} nodes")
 
-                gmsh_vertex_nrs = node_indices[:element_type.vertex_count()]
-                zero_based_idx = element_idx - 1
+                if tag_count:
+                    tag_numbers = [
+                        [tag] if tag != 0 else [] for tag in elements[:, 3].tolist()]
+                else:
+                    tag_numbers = [[] for _ in group]
 
-                tag_numbers = [tag for tag in tags[:1] if tag != 0]
+                if receiver.wants_lexicographic_nodes:
+                    lexicographic_nodes = node_indices[
+                        :, element_type.get_lexicographic_gmsh_node_indices()]
+                else:
+                    lexicographic_nodes = None
 
-                receiver.add_element(element_nr=zero_based_idx,
-                        element_type=element_type, vertex_nrs=gmsh_vertex_nrs,
-                        lexicographic_nodes=node_indices[
-                            element_type.get_lexicographic_gmsh_node_indices()],
+                receiver.add_elements(
+                        element_nrs=element_nrs,
+                        element_type=element_type,
+                        vertex_nrs=node_indices[:, :element_type.vertex_count()],
+                        lexicographic_nodes=lexicographic_nodes,
                         tag_numbers=tag_numbers)
 
-                element_idx += 1
-
-            if element_count+1 != element_idx:
+            next_line = feeder.get_next_line()
+            if next_line != f"$End{section_name}":
                 raise GmshFileFormatError(
-                    f"Unexpected number of elements found: got {element_idx} "
-                    f"elements but expected {element_count + 1}")
+                    "Unexpected number of elements found: expected "
+                    f"{element_count} elements, but found '{next_line}' after them")
 
             receiver.finalize_elements()
 
         elif section_name == "PhysicalNames":
             name_count = int(feeder.get_next_line())
-            name_idx = 1
+            name_lines = feeder.get_next_lines(name_count)
+
+            # NOTE: lines are stripped, so that e.g. a trailing '\r' does
+            # not keep the pattern from matching
+            names = _PHYSICAL_NAME_RE.findall(
+                "\n".join(line.strip() for line in name_lines))
+            if len(names) != name_count:
+                for line in name_lines:
+                    if _PHYSICAL_NAME_RE.fullmatch(line.strip()) is None:
+                        raise GmshFileFormatError(
+                            f"Invalid physical name line: <{line}>")
 
-            while True:
-                next_line = feeder.get_next_line()
-                if next_line == f"$End{section_name}":
-                    break
-
-                dimension_, number_, name = next_line.split(" ", 2)
-                dimension = int(dimension_)
-                number = int(number_)
-
-                if not name[0] == '"' or not name[-1] == '"':
-                    raise GmshFileFormatError(
-                        f"Expected quotes around physical name: <{name}>")
-
-                receiver.add_tag(name[1:-1], number, dimension)
+                raise GmshFileFormatError(
+                    f"Unexpected number of physical names found: "
+                    f"expected {name_count} names, but found {len(names)}")
 
-                name_idx += 1
+            for dimension, number, name in names:
+                receiver.add_tag(name, int(number), int(dimension))
 
-            if name_count+1 != name_idx:
+            next_line = feeder.get_next_line()
+            if next_line != f"$End{section_name}":
                 raise GmshFileFormatError(
-                    f"Unexpected number of physical names found: got {name_idx} "
-                    f"names but expected {name_count + 1} names")
+                    f"Unexpected number of physical names found: "
+                    f"expected {name_count} names")
 
             receiver.finalize_tags()
         else:
@@ -24,13 +24,19 @@ THE SOFTWARE.
 """
 
 import logging
-from collections.abc import Iterable
+import re
+import threading
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from types import TracebackType
-from typing import Literal
+from typing import TYPE_CHECKING, Any, Literal
 
-from packaging.version import Version
+from packaging.version import InvalidVersion, Version
 
-from pytools import memoize_method
+
+if TYPE_CHECKING:
+    from pytools.persistent_dict import PersistentDict
 
 
 logger = logging.getLogger(__name__)
@@ -43,6 +49,10 @@ __doc__ = """
 .. autoclass:: ScriptWithFilesSource
 
 .. autoclass:: GmshRunner
+
+gmsh is run in a temporary directory, which is created in the directory
+given by the ``GMSH_INTEROP_TMPDIR`` environment variable, if set,
+and in the default location of :func:`tempfile.mkdtemp` otherwise.
 """
 
 
@@ -52,35 +62,89 @@ class GmshError(RuntimeError):
 
 # {{{ tools
 
-def _erase_dir(dir: str) -> None:
-    from os import listdir, rmdir, unlink
-    from os.path import join
+def _stage_file(src: str, dest: str) -> None:
+    """Make the file *src* available as *dest*, preferably through a hard link,
+    which avoids copying the data.
+    """
+    import os
+    try:
+        os.link(src, dest)
+    except OSError:
+        # e.g. different file systems or no permission to link
+        from shutil import copyfile
+        copyfile(src, dest)
+
+
+_INDIRECT_FORKER_LOCK = threading.Lock()
+
 
-    for name in listdir(dir):
-        unlink(join(dir, name))
-    rmdir(dir)
+def _call_capture_output(
+        cmdline: Sequence[str],
+        cwd: str | None = None) -> tuple[int, bytes, bytes]:
+    from pytools import prefork
+
+    # NOTE: after pytools.prefork.enable_prefork(), all calls go through a
+    # single socket to the fork server, which must not be used concurrently
+    # (e.g. from GmshRunner.run_many)
+    if isinstance(prefork.forker, prefork.IndirectForker):
+        with _INDIRECT_FORKER_LOCK:
+            return prefork.call_capture_output(cmdline, cwd)
+
+    return prefork.call_capture_output(cmdline, cwd)
 
 
 class _TempDirManager:
     def __init__(self) -> None:
+        import os
         from tempfile import mkdtemp
-        self.path = mkdtemp()
+
+        # NOTE: this allows placing the working directory on a tmpfs (e.g.
+        # /dev/shm) without changing TMPDIR for the whole process
+        self.path = mkdtemp(prefix="gmsh-",
+                            dir=os.environ.get("GMSH_INTEROP_TMPDIR") or None)
+        self.owned = True
 
     def sub(self, n: str) -> str:
         from os.path import join
         return join(self.path, n)
 
-    def clean_up(self) -> None:
-        _erase_dir(self.path)
+    def move_to(self, dest: str) -> bool:
+        """Rename the directory to *dest* if that is possible without copying,
+        i.e. if *dest* does not exist and is on the same file system. The
+        directory is then no longer erased on clean up.
+
+        :returns: *True* if the directory was moved.
+        """
+        import os
 
-    def error_clean_up(self) -> None:
-        _erase_dir(self.path)
+        dest = os.path.abspath(dest)
+        if os.path.lexists(dest):
+            return False
+
+        try:
+            if os.stat(self.path).st_dev != os.stat(os.path.dirname(dest)).st_dev:
+                return False
+            os.rename(self.path, dest)
+        except OSError:
+            return False
+
+        self.path = dest
+        self.owned = False
+        return True
+
+    def clean_up(self) -> None:
+        if self.owned:
+            from shutil import rmtree
+            rmtree(self.path)
 
 
 class ScriptSource:  # noqa: B903
     """
     .. versionadded:: 2016.1
     """
+
+    __slots__ = ("extension", "source")
+
     def __init__(self, source: str, extension: str) -> None:
         self.source = source
         self.extension = extension
@@ -91,6 +155,8 @@ class LiteralSource(ScriptSource):
     .. versionadded:: 2014.1
     """
 
+    __slots__ = ()
+
     def __init__(self, source: str, extension: str) -> None:
         super().__init__(source, extension)
 
@@ -104,6 +170,8 @@ class FileSource:  # noqa: B903
     .. versionadded:: 2014.1
     """
 
+    __slots__ = ("filename",)
+
     def __init__(self, filename: str) -> None:
         self.filename = filename
 
@@ -122,21 +190,27 @@ class ScriptWithFilesSource:
         gmsh is run.
     """
 
+    __slots__ = ("filenames", "source", "source_name")
+
     def __init__(self,
                  source: str,
                  filenames: Iterable[str],
                  source_name: str = "temp.geo") -> None:
         self.source = source
         self.source_name = source_name
-        self.filenames = tuple(filenames)
+        self.filenames: tuple[str, ...] = tuple(filenames)
 
 
-def get_gmsh_version(executable: str = "gmsh") -> Version | None:
-    import re
-    re_version = re.compile(r"[0-9]+.[0-9]+.[0-9]+")
+_RE_VERSION = re.compile(r"[0-9]+\.[0-9]+\.[0-9]+")
+_RE_ERROR_AND_WARNING_COUNTS = re.compile(
+    rb"(?:(?P<errors>[0-9]+)\s+error\S*\s*)?(?:(?P<warnings>[0-9]+)\s+warning)?")
 
+_GMSH_VERSION_4 = Version("4.0.0")
+
+
+def _get_gmsh_version_uncached(executable: str) -> Version | None:
     def get_gmsh_version_from_string(output: str) -> Version | None:
-        result = re_version.search(output)
+        result = _RE_VERSION.search(output)
 
         try_version = None
         if result is not None:
@@ -144,8 +218,7 @@ def get_gmsh_version(executable: str = "gmsh") -> Version | None:
 
         return try_version
 
-    from pytools.prefork import call_capture_output
-    retcode, stdout, stderr = call_capture_output([executable, "-version"])
+    retcode, stdout, stderr = _call_capture_output([executable, "-version"])
 
     # NOTE: gmsh has changed how it displays its version over the years, with
     # it being displayed both on stderr and stdout -- so we try to cover it all!
@@ -158,7 +231,167 @@ def get_gmsh_version(executable: str = "gmsh") -> Version | None:
     return version
 
 
+_GMSH_VERSION_CACHE: dict[tuple[str, int], Version] = {}
+_GMSH_VERSION_DISK_CACHE: "PersistentDict[tuple[str, int], str] | None" = None
+
+
+def _get_gmsh_version_disk_cache() -> "PersistentDict[tuple[str, int], str] | None":
+    """Return the persistent gmsh version cache, or *None* if it cannot be
+    opened (e.g. because the cache directory is not writable).
+    """
+    global _GMSH_VERSION_DISK_CACHE
+    if _GMSH_VERSION_DISK_CACHE is None:
+        import sqlite3
+
+        from pytools.persistent_dict import PersistentDict
+        try:
+            _GMSH_VERSION_DISK_CACHE = PersistentDict(
+                "gmsh_interop-version", safe_sync=False)
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning("could not open the gmsh version cache: %s", exc)
+            return None
+
+    return _GMSH_VERSION_DISK_CACHE
+
+
+def get_gmsh_version(executable: str = "gmsh") -> Version | None:
+    """Return the version of the gmsh *executable*, or *None* if it cannot
+    be determined. The result is cached for each executable until it is
+    modified on disk, both in memory and in a persistent on-disk cache, so
+    that the executable is usually only probed once. The on-disk cache is
+    skipped if it cannot be used.
+    """
+    import os
+    import sqlite3
+    from shutil import which
+
+    path = which(executable)
+    if path is None:
+        # let the probe report the missing executable
+        return _get_gmsh_version_uncached(executable)
+
+    real_path = os.path.realpath(path)
+    key = (real_path, os.stat(real_path).st_mtime_ns)
+    try:
+        return _GMSH_VERSION_CACHE[key]
+    except KeyError:
+        pass
+
+    from pytools.persistent_dict import NoSuchEntryError
+    disk_cache = _get_gmsh_version_disk_cache()
+
+    result: Version | None = None
+    if disk_cache is not None:
+        try:
+            result = Version(disk_cache.fetch(key))
+        except (NoSuchEntryError, InvalidVersion, TypeError):
+            # NOTE: a stale or corrupt entry is re-probed and overwritten
+            pass
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning("could not read the gmsh version cache: %s", exc)
+
+    if result is None:
+        result = _get_gmsh_version_uncached(path)
+
+        # NOTE: failed probes are not cached, since they may be transient
+        if result is None:
+            return None
+
+        if disk_cache is not None:
+            try:
+                disk_cache.store(key, str(result))
+            except (OSError, sqlite3.Error) as exc:
+                logger.warning("could not write the gmsh version cache: %s", exc)
+
+    _GMSH_VERSION_CACHE[key] = result
+    return result
+
+
+def _confirm_overwrite(path: str) -> bool:
+    import select
+    import sys
+
+    if not sys.stdin.isatty():
+        # nobody to ask, go with the default
+        return True
+
+    print(f"{path} exists! "
+        "Overwrite? (Y/N, will default to Y in 10sec).")
+    decision = None
+    while decision is None:
+        i, _o, _e = select.select([sys.stdin], [], [], 10)
+        if i:
+            resp = sys.stdin.readline().strip()
+            if resp == "N" or resp == "n":
+                logger.info("Not overwriting.")
+                decision = 0
+            elif resp == "Y" or resp == "y":
+                decision = 1
+                logger.info("Overwriting.")
+            else:
+                print(f"Illegal input '{resp}', please retry.")
+        else:
+            decision = 1  # default
+
+    return decision == 1
+
+
+def _get_error_and_warning_counts(stdout: bytes) -> tuple[int, int]:
+    """Return the number of errors and warnings that gmsh reports at the
+    start of *stdout*, each defaulting to 0.
+    """
+    count_match = _RE_ERROR_AND_WARNING_COUNTS.match(stdout)
+    assert count_match is not None
+
+    num_errors, num_warnings = count_match.group("errors", "warnings")
+    return int(num_errors or 0), int(num_warnings or 0)
+
+
+def _format_gmsh_output(stdout: bytes, stderr: bytes) -> str:
+    msg = ""
+    if stdout:
+        msg += stdout.decode("utf-8")+"\n"
+    msg += stderr.decode("utf-8")+"\n"
+
+    return msg
+
+
 class GmshRunner:
+    """
+    .. attribute:: output_file
+
+        The mesh written by gmsh, opened for reading. Only available
+        inside the ``with`` block.
+
+    .. attribute:: output_file_path
+
+        The path of :attr:`output_file`, e.g. for reading the mesh with
+        other tools. The file is removed on exit from the ``with`` block
+        unless it was saved to *save_tmp_files_in*.
+    """
+
+    __slots__ = (
+        "_exit_stack",
+        "_home_dir",
+        "_options",
+        "_source_file_name",
+        "dimensions",
+        "gmsh_executable",
+        "gmsh_tmp_file_name",
+        "incomplete_elements",
+        "num_threads",
+        "order",
+        "other_options",
+        "output_file",
+        "output_file_name",
+        "output_file_path",
+        "overwrite",
+        "save_tmp_files_in",
+        "source",
+        "target_unit",
+        "temp_dir_mgr",
+        )
+
     def __init__(
             self,
             source: str | ScriptSource | FileSource | ScriptWithFilesSource,
@@ -170,7 +403,9 @@ class GmshRunner:
             gmsh_executable: str = "gmsh",
             output_file_name: str | None = None,
             target_unit: Literal["M", "MM"] | None = None,
-            save_tmp_files_in: str | None = None) -> None:
+            save_tmp_files_in: str | None = None,
+            num_threads: int | None = None,
+            overwrite: Literal["ask", "yes", "no"] = "ask") -> None:
         if isinstance(source, str):
             from warnings import warn
             warn("passing a string as 'source' is deprecated -- use "
@@ -196,6 +431,8 @@ class GmshRunner:
         self.gmsh_executable = gmsh_executable
         self.output_file_name = output_file_name
         self.save_tmp_files_in = save_tmp_files_in
+        self.num_threads = num_threads
+        self.overwrite = overwrite
         self.target_unit = target_unit.upper()
 
         if self.dimensions not in [1, 2, 3, None]:
@@ -204,8 +441,20 @@ class GmshRunner:
         if self.target_unit not in ["M", "MM"]:
             raise RuntimeError("units must be 'M' (meters) or 'MM' (millimeters)")
 
+        if self.overwrite not in ["ask", "yes", "no"]:
+            raise RuntimeError("overwrite must be one of 'ask', 'yes' or 'no'")
+
+        self.gmsh_tmp_file_name: str | None = None
+        self._options: tuple[str, ...] | None = None
+
+        # NOTE: resolved once, so that re-entering the runner does not repeat
+        # the lookups
+        from os.path import abspath, expanduser
+        self._home_dir = expanduser("~")
+        self._source_file_name = (
+            abspath(source.filename) if isinstance(source, FileSource) else None)
+
     @property
-    @memoize_method
     def version(self) -> Version:
         result = get_gmsh_version(self.gmsh_executable)
         if result is None:
@@ -213,173 +462,208 @@ class GmshRunner:
 
         return result
 
+    def _get_options(self) -> tuple[str, ...]:
+        """Return the gmsh command line options that do not depend on the
+        working directory. They are built on first use, so that gmsh is only
+        probed for its version once the runner is entered.
+        """
+        if self._options is not None:
+            return self._options
+
+        options = [
+                "-o", self.output_file_name,
+                "-nopopup",
+                "-format", "msh2",
+                ]
+
+        # NOTE: handle unit incompatibility introduced in GMSH4
+        # https://gitlab.onelab.info/gmsh/gmsh/issues/397
+        if self.version < _GMSH_VERSION_4:
+            if self.target_unit == "M":
+                options.extend(["-setnumber", "Geometry.OCCScaling", "1000"])
+        else:
+            options.extend(["-setstring",
+                "Geometry.OCCTargetUnit", self.target_unit])
+
+        if self.dimensions is not None:
+            options.append(f"-{self.dimensions}")
+
+        if self.order is not None:
+            options.extend(["-order", str(self.order)])
+
+        if self.incomplete_elements is not None:
+            options.extend(["-setstring",
+                "Mesh.SecondOrderIncomplete", str(int(self.incomplete_elements))])
+
+        if self.num_threads is not None:
+            options.extend(["-nt", str(self.num_threads)])
+
+        options.extend(self.other_options)
+
+        self._options = tuple(options)
+        return self._options
+
+    def _remove_gmsh_tmp_file(self) -> None:
+        if self.gmsh_tmp_file_name is None:
+            return
+
+        import os
+        try:
+            os.unlink(self.gmsh_tmp_file_name)
+        except FileNotFoundError:
+            pass
+
+        self.gmsh_tmp_file_name = None
+
     def __enter__(self) -> "GmshRunner":
         self.temp_dir_mgr = None
-        temp_dir_mgr = _TempDirManager()
-        try:
+        self.gmsh_tmp_file_name = None
+        with ExitStack() as stack:
+            # NOTE: callbacks run in reverse order, so the output file is
+            # closed before the directory containing it is removed
+            temp_dir_mgr = _TempDirManager()
+            stack.callback(temp_dir_mgr.clean_up)
+            stack.callback(self._remove_gmsh_tmp_file)
+
             working_dir = temp_dir_mgr.path
-            from os.path import abspath, exists, join
+            from os.path import exists, join
 
             if isinstance(self.source, ScriptSource):
                 source_file_name = join(
                         working_dir, "temp."+self.source.extension)
-                with open(source_file_name, "w") as source_file:
-                    source_file.write(self.source.source)
+                with open(source_file_name, "wb") as source_file:
+                    source_file.write(self.source.source.encode("utf-8"))
 
             elif isinstance(self.source, FileSource):
-                source_file_name = abspath(self.source.filename)
+                assert self._source_file_name is not None
+                source_file_name = self._source_file_name
                 if not exists(source_file_name):
                     raise OSError(f"'{source_file_name}' does not exist")
 
             elif isinstance(self.source, ScriptWithFilesSource):
                 source_file_name = join(
                         working_dir, self.source.source_name)
-                with open(source_file_name, "w") as source_file:
-                    source_file.write(self.source.source)
+                with open(source_file_name, "wb") as source_file:
+                    source_file.write(self.source.source.encode("utf-8"))
 
                 from os.path import basename
-                from shutil import copyfile
                 for f in self.source.filenames:
-                    copyfile(f, join(working_dir, basename(f)))
+                    _stage_file(f, join(working_dir, basename(f)))
 
             else:
                 raise RuntimeError("'source' type unrecognized")
 
             # gmsh uses a "~/.gmsh-tmp" by default as a temporary file name.
             # Unfortunately, GMSH also automatically prepends the home
-            # directory to this.
-            import tempfile
-            from os.path import basename, expanduser
-            with tempfile.NamedTemporaryFile(
-                    delete=False, dir=expanduser("~")) as tmpf:
-                gmsh_tmp_name = basename(tmpf.name)
+            # directory to this, so pick a unique name there.
+            import os
+            import secrets
+            gmsh_tmp_name = f".gmsh-tmp-{os.getpid()}-{secrets.token_hex(8)}"
+            self.gmsh_tmp_file_name = join(self._home_dir, gmsh_tmp_name)
 
             output_file_name = join(working_dir, self.output_file_name)
             cmdline = [
                     self.gmsh_executable,
                     "-setstring", "General.TmpFileName", gmsh_tmp_name,
-                    "-o", self.output_file_name,
-                    "-nopopup",
-                    "-format", "msh2",
+                    *self._get_options(),
+                    source_file_name,
                     ]
-
-            # NOTE: handle unit incompatibility introduced in GMSH4
-            # https://gitlab.onelab.info/gmsh/gmsh/issues/397
-            if self.version < Version("4.0.0"):
-                if self.target_unit == "M":
-                    cmdline.extend(["-setnumber", "Geometry.OCCScaling", "1000"])
-            else:
-                cmdline.extend(["-setstring",
-                    "Geometry.OCCTargetUnit", self.target_unit])
-
-            if self.dimensions is not None:
-                cmdline.append(f"-{self.dimensions}")
-
-            if self.order is not None:
-                cmdline.extend(["-order", str(self.order)])
-
-            if self.incomplete_elements is not None:
-                cmdline.extend(["-setstring",
-                    "Mesh.SecondOrderIncomplete", str(int(self.incomplete_elements))])
-
-            cmdline.extend(self.other_options)
-            cmdline.append(source_file_name)
-
             if self.dimensions is None:
                 cmdline.append("-")
 
-            logger.info("invoking gmsh: '%s'", " ".join(cmdline))
-            from pytools.prefork import call_capture_output
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("invoking gmsh: '%s'", " ".join(cmdline))
 
-            _retcode, stdout_b, stderr_b = call_capture_output(cmdline, working_dir)
+            _retcode, stdout_b, stderr_b = _call_capture_output(cmdline, working_dir)
             logger.info("return from gmsh")
 
-            stdout = stdout_b.decode("utf-8")
-            stderr = stderr_b.decode("utf-8")
-
-            import re
-            error_match = re.match(r"([0-9]+)\s+error", stdout)
-            warning_match = re.match(r"([0-9]+)\s+warning", stdout)
-
-            if error_match is not None or warning_match is not None:
-                # if we have one, we expect to see both
-                assert error_match is not None
-                assert warning_match is not None
-
-                num_warnings = int(warning_match.group(1))
-                num_errors = int(error_match.group(1))
-            else:
-                num_warnings = 0
-                num_errors = 0
+            # NOTE: the output is only decoded if it ends up in a message
+            num_errors, num_warnings = _get_error_and_warning_counts(stdout_b)
 
             if num_errors:
                 msg = "gmsh execution failed with message:\n\n"
-                if stdout:
-                    msg += stdout+"\n"
-                msg += stderr+"\n"
+                msg += _format_gmsh_output(stdout_b, stderr_b)
                 raise GmshError(msg)
 
             if num_warnings:
                 from warnings import warn
 
                 msg = "gmsh issued the following warning messages:\n\n"
-                if stdout:
-                    msg += stdout+"\n"
-                msg += stderr+"\n"
+                msg += _format_gmsh_output(stdout_b, stderr_b)
                 warn(msg, stacklevel=2)
 
-            self.output_file = open(output_file_name)
+            # NOTE: msh2 output is ASCII (physical names may be UTF-8), so
+            # decode explicitly instead of depending on the locale
+            self.output_file = stack.enter_context(
+                open(output_file_name, encoding="utf-8"))
 
-            if self.save_tmp_files_in:
+            # NOTE: moving the working directory does not affect the already
+            # opened output file; copy it only if it cannot be moved
+            if (self.save_tmp_files_in
+                    and not temp_dir_mgr.move_to(self.save_tmp_files_in)):
                 import errno
                 import shutil
-                try:
-                    shutil.copytree(working_dir, self.save_tmp_files_in)
-                except FileExistsError:
-                    import select
-                    import sys
-                    print(f"{self.save_tmp_files_in} exists! "
-                        "Overwrite? (Y/N, will default to Y in 10sec).")
-                    decision = None
-                    while decision is None:
-                        i, _o, _e = select.select([sys.stdin], [], [], 10)
-                        if i:
-                            resp = sys.stdin.readline().strip()
-                            if resp == "N" or resp == "n":
-                                logger.info("Not overwriting.")
-                                decision = 0
-                            elif resp == "Y" or resp == "y" or not i:
-                                decision = 1
-                                logger.info("Overwriting.")
-                            else:
-                                print(f"Illegal input '{i}', please retry.")
+                from os.path import isdir
+
+                if not isdir(self.save_tmp_files_in):
+                    do_copy = True
+                elif self.overwrite == "ask":
+                    do_copy = _confirm_overwrite(self.save_tmp_files_in)
+                else:
+                    do_copy = self.overwrite == "yes"
+
+                if do_copy:
+                    try:
+                        shutil.copytree(working_dir, self.save_tmp_files_in,
+                                        dirs_exist_ok=True)
+                    except OSError as exc:
+                        if exc.errno == errno.ENOTDIR:
+                            shutil.copy(output_file_name,
+                                        "/".join([self.save_tmp_files_in,
+                                                  self.output_file_name]))
                         else:
-                            decision = 1  # default
-                    if decision == 0:
-                        pass
-                    else:
-                        assert decision == 1
-                        shutil.rmtree(self.save_tmp_files_in)
-                        shutil.copytree(working_dir, self.save_tmp_files_in)
-                except OSError as exc:
-                    if exc.errno == errno.ENOTDIR:
-                        shutil.copy(output_file_name,
-                                    "/".join([self.save_tmp_files_in,
-                                              self.output_file_name]))
-                    else:
-                        raise
+                            raise
 
+            self.output_file_path = temp_dir_mgr.sub(self.output_file_name)
             self.temp_dir_mgr = temp_dir_mgr
+            self._exit_stack = stack.pop_all()
 
             return self
-        except Exception:
-            temp_dir_mgr.clean_up()
-            raise
 
     def __exit__(self,
                  type: type[BaseException] | None,
                  value: BaseException | None,
                  traceback: TracebackType | None) -> None:
-        self.output_file.close()
-        if self.temp_dir_mgr is not None:
-            self.temp_dir_mgr.clean_up()
+        self._exit_stack.close()
+
+    @classmethod
+    def run_many(cls,
+                 sources: Iterable[ScriptSource | FileSource | ScriptWithFilesSource],
+                 *, max_workers: int | None = None,
+                 **kwargs: Any) -> Sequence[str]:
+        """Run gmsh on each of *sources* concurrently, using up to
+        *max_workers* (by default, the number of CPUs) simultaneous gmsh
+        processes. The remaining keyword arguments are passed on to
+        :class:`GmshRunner`, except for *save_tmp_files_in*, since all runs
+        would save their files to the same directory.
+
+        If :func:`pytools.prefork.enable_prefork` is in effect, the runs are
+        serialized, since the fork server cannot be used concurrently.
+
+        :returns: the contents of the output files, in the order of *sources*.
+        """
+        import os
+
+        if kwargs.get("save_tmp_files_in") is not None:
+            raise TypeError("run_many does not support 'save_tmp_files_in'")
+
+        def run(source: ScriptSource | FileSource | ScriptWithFilesSource) -> str:
+            with cls(source, **kwargs) as runner:
+                return runner.output_file.read()
+
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+
+        with ThreadPoolExecutor(max_workers=max_workers,
+                                thread_name_prefix="gmsh") as executor:
+            return list(executor.map(run, sources))
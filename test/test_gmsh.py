@@ -21,27 +21,40 @@ THE SOFTWARE.
 """
 
 
+import pathlib
+from collections.abc import Iterator
+from functools import lru_cache
+
 import pytest
 
 
 # {{{ gmsh
 
-def search_on_path(filenames: list[str]) -> str | None:
-    """Find file on system path."""
-    # http://aspn.activestate.com/ASPN/Cookbook/Python/Recipe/52224
+@pytest.fixture(autouse=True, scope="session")
+def gmsh_version_disk_cache(
+        tmp_path_factory: pytest.TempPathFactory) -> Iterator[None]:
+    """Keep the persistent gmsh version cache out of the user's cache
+    directory.
+    """
+    from pytools.persistent_dict import PersistentDict
+
+    from gmsh_interop import runner
 
-    from os import environ, pathsep
-    from os.path import abspath, exists, join
+    disk_cache: PersistentDict[tuple[str, int], str] = PersistentDict(
+        "gmsh_interop-version",
+        container_dir=str(tmp_path_factory.mktemp("cache")),
+        safe_sync=False)
 
-    search_path = environ["PATH"]
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(runner, "_GMSH_VERSION_DISK_CACHE", disk_cache)
+        yield
 
-    paths = search_path.split(pathsep)
-    for path in paths:
-        for filename in filenames:
-            if exists(join(path, filename)):
-                return abspath(join(path, filename))
 
-    return None
+@lru_cache(maxsize=1)
+def find_gmsh() -> str | None:
+    """Find the gmsh executable on the system path."""
+    from shutil import which
+    return which("gmsh")
 
 
 GMSH_SPHERE = """
@@ -107,7 +120,7 @@ Mesh 3;
 def test_simplex_gmsh(dim: int,
                       order: int,
                       visualize: bool = False) -> None:
-    if search_on_path(["gmsh"]) is None:
+    if find_gmsh() is None:
         pytest.skip("gmsh executable not found")
 
     if visualize:
@@ -129,7 +142,7 @@ def test_simplex_gmsh(dim: int,
 def test_quad_gmsh(dim: int,
                    order: int,
                    visualize: bool = False) -> None:
-    if search_on_path(["gmsh"]) is None:
+    if find_gmsh() is None:
         pytest.skip("gmsh executable not found")
 
     if visualize:
@@ -149,25 +162,460 @@ def test_quad_gmsh(dim: int,
     generate_gmsh(mr, source, dimensions=dim, order=order,
             save_tmp_files_in=save_tmp_files_in)
 
+
+def test_save_tmp_files_in(tmp_path: pathlib.Path) -> None:
+    if find_gmsh() is None:
+        pytest.skip("gmsh executable not found")
+
+    from gmsh_interop.reader import GmshMeshReceiverBase, generate_gmsh
+    from gmsh_interop.runner import ScriptSource
+
+    save_tmp_files_in = tmp_path / "saved"
+    generate_gmsh(GmshMeshReceiverBase(), ScriptSource(GMSH_QUAD_SPHERE, "geo"),
+            dimensions=2, order=1, target_unit="MM",
+            save_tmp_files_in=str(save_tmp_files_in))
+
+    assert (save_tmp_files_in / "output.msh").exists()
+    assert (save_tmp_files_in / "temp.geo").exists()
+
+    # saving into an existing directory overwrites its contents on request
+    from unittest import mock
+
+    (save_tmp_files_in / "output.msh").unlink()
+    with mock.patch("gmsh_interop.runner._confirm_overwrite",
+                    return_value=True) as confirm:
+        generate_gmsh(GmshMeshReceiverBase(),
+                ScriptSource(GMSH_QUAD_SPHERE, "geo"),
+                dimensions=2, order=1, target_unit="MM",
+                save_tmp_files_in=str(save_tmp_files_in))
+
+    confirm.assert_called_once()
+    assert (save_tmp_files_in / "output.msh").exists()
+
+    # an explicit choice never prompts
+    from gmsh_interop.runner import GmshRunner
+
+    (save_tmp_files_in / "output.msh").unlink()
+    runner = GmshRunner(ScriptSource(GMSH_QUAD_SPHERE, "geo"), 2,
+            target_unit="MM", save_tmp_files_in=str(save_tmp_files_in),
+            overwrite="no")
+    with mock.patch("gmsh_interop.runner._confirm_overwrite") as confirm, runner:
+        output_file_path = pathlib.Path(runner.output_file_path)
+        assert output_file_path.read_text() == runner.output_file.read()
+
+    confirm.assert_not_called()
+    assert not (save_tmp_files_in / "output.msh").exists()
+    assert not output_file_path.exists()
+
+
+def test_runner_clean_up_on_error(tmp_path: pathlib.Path,
+                                  monkeypatch: pytest.MonkeyPatch) -> None:
+    from gmsh_interop.runner import FileSource, GmshRunner
+
+    work_dir = tmp_path / "work"
+    work_dir.mkdir()
+    monkeypatch.setenv("GMSH_INTEROP_TMPDIR", str(work_dir))
+
+    runner = GmshRunner(FileSource(str(tmp_path / "missing.geo")), 2,
+            target_unit="MM")
+    with pytest.raises(OSError), runner:
+        pass
+
+    assert not list(work_dir.iterdir())
+
+
+def test_script_with_files_source(tmp_path: pathlib.Path) -> None:
+    if find_gmsh() is None:
+        pytest.skip("gmsh executable not found")
+
+    from gmsh_interop.reader import GmshMeshReceiverNumPy, generate_gmsh
+    from gmsh_interop.runner import ScriptWithFilesSource
+
+    geo_file = tmp_path / "sphere.geo"
+    geo_file.write_text(GMSH_QUAD_SPHERE)
+
+    mr = GmshMeshReceiverNumPy()
+    source = ScriptWithFilesSource('Include "sphere.geo";', [str(geo_file)])
+    generate_gmsh(mr, source, dimensions=2, order=1, target_unit="MM")
+
+    assert mr.points is not None
+    assert len(mr.points) > 0
+    assert geo_file.read_text() == GMSH_QUAD_SPHERE
+
+
+def test_run_many() -> None:
+    if find_gmsh() is None:
+        pytest.skip("gmsh executable not found")
+
+    from gmsh_interop.reader import GmshMeshReceiverNumPy, parse_gmsh
+    from gmsh_interop.runner import GmshRunner, ScriptSource
+
+    sources = [
+        ScriptSource(GMSH_SPHERE, "geo"),
+        ScriptSource(GMSH_QUAD_SPHERE, "geo"),
+        ScriptSource(GMSH_SPHERE, "geo"),
+        ]
+    outputs = GmshRunner.run_many(sources, max_workers=2,
+            dimensions=2, target_unit="MM")
+
+    assert len(outputs) == len(sources)
+    for output in outputs:
+        mr = GmshMeshReceiverNumPy()
+        parse_gmsh(mr, output.splitlines())
+        assert mr.points is not None
+        assert len(mr.points) > 0
+
+    assert outputs[0] == outputs[2]
+
+    # all runs would save to the same directory
+    with pytest.raises(TypeError):
+        GmshRunner.run_many(sources, dimensions=2, target_unit="MM",
+                save_tmp_files_in="saved")
+
+
+@pytest.mark.parametrize(("stdout", "counts"), [
+    (b"", (0, 0)),
+    (b"Info    : Done meshing", (0, 0)),
+    (b"1 error", (1, 0)),
+    (b"3 warnings", (0, 3)),
+    (b"2 errors, 5 warnings", (2, 5)),
+    (b"1 error(s)\n4 warning(s)", (1, 4)),
+    ])
+def test_error_and_warning_counts(stdout: bytes, counts: tuple[int, int]) -> None:
+    from gmsh_interop.runner import _get_error_and_warning_counts
+    assert _get_error_and_warning_counts(stdout) == counts
+
+
+def test_call_capture_output_with_prefork() -> None:
+    from unittest import mock
+
+    from pytools import prefork
+
+    from gmsh_interop import runner
+
+    def call_capture_output(cmdline: list[str],
+                            cwd: str | None = None,
+                            error_on_nonzero: bool = True
+                            ) -> tuple[int, bytes, bytes]:
+        # the fork server must only be used by one thread at a time
+        assert runner._INDIRECT_FORKER_LOCK.locked()
+        return 0, b"", b""
+
+    forker = mock.create_autospec(prefork.IndirectForker, instance=True)
+    forker.call_capture_output.side_effect = call_capture_output
+    with mock.patch.object(prefork, "forker", forker):
+        assert runner._call_capture_output(["gmsh"]) == (0, b"", b"")
+
+    forker.call_capture_output.assert_called_once()
+
+
+def test_gmsh_version_cached() -> None:
+    if find_gmsh() is None:
+        pytest.skip("gmsh executable not found")
+
+    from unittest import mock
+
+    from gmsh_interop.runner import get_gmsh_version
+
+    version = get_gmsh_version()
+    assert version is not None
+
+    with mock.patch("gmsh_interop.runner._get_gmsh_version_uncached") as probe:
+        assert get_gmsh_version() == version
+
+        # a new process only has the on-disk cache
+        with mock.patch.dict("gmsh_interop.runner._GMSH_VERSION_CACHE", clear=True):
+            assert get_gmsh_version() == version
+
+    probe.assert_not_called()
+
+    # a corrupt entry is re-probed and overwritten
+    import os
+
+    from gmsh_interop.runner import _get_gmsh_version_disk_cache
+
+    gmsh_path = os.path.realpath(find_gmsh() or "")
+    key = (gmsh_path, os.stat(gmsh_path).st_mtime_ns)
+    disk_cache = _get_gmsh_version_disk_cache()
+    assert disk_cache is not None
+    disk_cache.store(key, "not a version")
+
+    with mock.patch.dict("gmsh_interop.runner._GMSH_VERSION_CACHE", clear=True):
+        assert get_gmsh_version() == version
+
+    assert disk_cache.fetch(key) == str(version)
+
+
+# NOTE: PersistentDict.__del__ complains about the half-constructed cache
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnraisableExceptionWarning")
+def test_gmsh_version_unusable_disk_cache(tmp_path: pathlib.Path) -> None:
+    if find_gmsh() is None:
+        pytest.skip("gmsh executable not found")
+
+    from unittest import mock
+
+    from gmsh_interop.runner import get_gmsh_version
+
+    # a cache directory below a regular file cannot be created
+    not_a_dir = tmp_path / "not-a-dir"
+    not_a_dir.write_text("")
+
+    with mock.patch.dict("os.environ", {"XDG_CACHE_HOME": str(not_a_dir)}), \
+            mock.patch("gmsh_interop.runner._GMSH_VERSION_DISK_CACHE", None), \
+            mock.patch.dict("gmsh_interop.runner._GMSH_VERSION_CACHE", clear=True):
+        assert get_gmsh_version() is not None
+
 # }}}
 
 
+GMSH_SQUARE_MSH = """
+$MeshFormat
+2.2 0 8
+$EndMeshFormat
+$PhysicalNames
+2
+1 1 "boundary"
+2 2 "domain"
+$EndPhysicalNames
+$Nodes
+4
+1 0 0 0
+2 1 0 0
+3 1 1 0
+4 0 1 0
+$EndNodes
+$Elements
+4
+1 1 2 1 1 1 2
+2 1 2 1 1 2 3
+3 2 2 2 1 1 2 3
+4 2 2 2 1 1 3 4
+$EndElements
+""".lstrip()
+
+
+@pytest.mark.parametrize("from_file", [False, True])
+@pytest.mark.parametrize("force_dimension", [None, 2])
+def test_parse_gmsh(force_dimension: int | None, from_file: bool) -> None:
+    from io import StringIO
+
+    import numpy as np
+
+    from gmsh_interop.reader import GmshMeshReceiverNumPy, parse_gmsh
+
+    mr = GmshMeshReceiverNumPy()
+    parse_gmsh(mr,
+               StringIO(GMSH_SQUARE_MSH) if from_file else GMSH_SQUARE_MSH.splitlines(),
+               force_dimension=force_dimension)
+
+    ambient_dim = 3 if force_dimension is None else force_dimension
+    assert mr.points is not None
+    assert mr.points.shape == (4, ambient_dim)
+    assert np.array_equal(mr.points[2], [1, 1, 0][:ambient_dim])
+
+    assert mr.element_vertex_nrs is not None
+    assert mr.element_type_numbers is not None
+    assert mr.element_vertex_nrs[:, :3].tolist() == [
+        [0, 1, -1], [1, 2, -1], [0, 1, 2], [0, 2, 3]]
+    assert (mr.element_vertex_nrs[:, 3:] == -1).all()
+    assert mr.element_type_numbers.tolist() == [1, 1, 2, 2]
+
+    # only the compact arrays are stored, per-element objects are built lazily
+    assert mr.element_vertex_nrs.dtype == np.intp
+    assert mr.element_type_numbers.dtype == np.int32
+    assert [name for name, value in vars(mr).items()
+            if isinstance(value, np.ndarray) and value.dtype == object] == [
+        "element_markers"]
+
+    assert mr.elements is not None
+    assert mr.element_types is not None
+    assert mr.element_markers is not None
+    assert len(mr.elements) == 4
+    assert [list(el) for el in mr.elements if el is not None] == [
+        [0, 1], [1, 2], [0, 1, 2], [0, 2, 3]]
+    assert [el.dimensions for el in mr.element_types if el is not None] == [
+        1, 1, 2, 2]
+    assert [list(m) for m in mr.element_markers if m is not None] == [
+        [1], [1], [2], [2]]
+
+    assert mr.tags == [("boundary", 1, 1), ("domain", 2, 2)]
+
+
+def test_parse_gmsh_errors() -> None:
+    from gmsh_interop.reader import (
+        GmshFileFormatError,
+        GmshMeshReceiverBase,
+        parse_gmsh,
+    )
+
+    lines = GMSH_SQUARE_MSH.splitlines()
+
+    # out-of-order node
+    bad_lines = [*lines]
+    bad_lines[bad_lines.index("3 1 1 0")] = "5 1 1 0"
+    with pytest.raises(GmshFileFormatError):
+        parse_gmsh(GmshMeshReceiverBase(), bad_lines)
+
+    # missing node
+    bad_lines = [*lines]
+    bad_lines.remove("3 1 1 0")
+    with pytest.raises(GmshFileFormatError):
+        parse_gmsh(GmshMeshReceiverBase(), bad_lines)
+
+    # blank line in place of a node
+    bad_lines = [*lines]
+    bad_lines[bad_lines.index("3 1 1 0")] = ""
+    with pytest.raises(GmshFileFormatError):
+        parse_gmsh(GmshMeshReceiverBase(), bad_lines)
+
+    # wrong number of nodes in an element
+    bad_lines = [*lines]
+    bad_lines[bad_lines.index("4 2 2 2 1 1 3 4")] = "4 2 2 2 1 1 3"
+    with pytest.raises(GmshFileFormatError):
+        parse_gmsh(GmshMeshReceiverBase(), bad_lines)
+
+    # truncated file
+    with pytest.raises(GmshFileFormatError):
+        parse_gmsh(GmshMeshReceiverBase(), lines[:-3])
+
+
+def test_parse_gmsh_physical_names() -> None:
+    from gmsh_interop.reader import (
+        GmshFileFormatError,
+        GmshMeshReceiverNumPy,
+        parse_gmsh,
+    )
+
+    lines = GMSH_SQUARE_MSH.splitlines()
+
+    # any whitespace between fields, quotes inside names
+    names_lines = [*lines]
+    names_lines[names_lines.index('2 2 "domain"')] = '2\t2  "the "inner" domain"'
+    mr = GmshMeshReceiverNumPy()
+    parse_gmsh(mr, names_lines)
+    assert mr.tags == [("boundary", 1, 1), ('the "inner" domain', 2, 2)]
+
+    # CRLF line endings
+    mr = GmshMeshReceiverNumPy()
+    parse_gmsh(mr, [f"{line}\r\n" for line in lines])
+    assert mr.tags == [("boundary", 1, 1), ("domain", 2, 2)]
+
+    # unquoted name
+    bad_lines = [*lines]
+    bad_lines[bad_lines.index('2 2 "domain"')] = "2 2 domain"
+    with pytest.raises(GmshFileFormatError):
+        parse_gmsh(GmshMeshReceiverNumPy(), bad_lines)
+
+
+def test_read_gmsh_cached(tmp_path: pathlib.Path) -> None:
+    import os
+
+    from gmsh_interop.reader import GmshMeshReceiverNumPy, read_gmsh_cached
+
+    mesh_file = tmp_path / "square.msh"
+    mesh_file.write_text(GMSH_SQUARE_MSH)
+
+    mr_a = GmshMeshReceiverNumPy()
+    read_gmsh_cached(mr_a, str(mesh_file))
+    mr_b = GmshMeshReceiverNumPy()
+    read_gmsh_cached(mr_b, str(mesh_file))
+
+    assert mr_a.points is not None
+    assert mr_b.points is not None
+    assert (mr_a.points == mr_b.points).all()
+    assert mr_a.tags == mr_b.tags
+
+    # the receiver's settings are honored, even if the file is already cached
+    from collections.abc import Sequence
+
+    from gmsh_interop.reader import GmshElementBase, GmshMeshReceiverBase
+
+    class LexicographicReceiver(GmshMeshReceiverBase):
+        def __init__(self) -> None:
+            self.lexicographic_nodes: list[object] = []
+            self.tag_numbers: list[Sequence[Sequence[int]]] = []
+
+        def add_elements(self,
+                         element_nrs: object,
+                         element_type: GmshElementBase,
+                         vertex_nrs: object,
+                         lexicographic_nodes: object,
+                         tag_numbers: Sequence[Sequence[int]]) -> None:
+            self.lexicographic_nodes.append(lexicographic_nodes)
+            self.tag_numbers.append(tag_numbers)
+
+    mr_lex = LexicographicReceiver()
+    read_gmsh_cached(mr_lex, str(mesh_file))
+    assert mr_lex.lexicographic_nodes
+    assert all(nodes is not None for nodes in mr_lex.lexicographic_nodes)
+
+    # shared tags cannot be modified by a receiver
+    assert all(isinstance(tags, tuple)
+               for group in mr_lex.tag_numbers for tags in group)
+
+    # modifying the file invalidates the cache
+    mesh_file.write_text(GMSH_SQUARE_MSH.replace("3 1 1 0", "3 2 2 0"))
+    stat = os.stat(mesh_file)
+    os.utime(mesh_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    mr_c = GmshMeshReceiverNumPy()
+    read_gmsh_cached(mr_c, str(mesh_file))
+    assert mr_c.points is not None
+    assert list(mr_c.points[2]) == [2, 2, 0]
+
+
 def test_lex_node_ordering() -> None:
     """Check that lex nodes go through axes 'in order', i.e. that the
     r-axis is the first one to become non-zero, then s, then t.
     """
+    import numpy as np
+
+    from gmsh_interop.reader import _gmsh_supported_element_type_map
+
+    for el in _gmsh_supported_element_type_map().values():
+        nonzero = el.lexicographic_node_tuple_array() != 0
+        assert nonzero.any(axis=0).all()
+
+        # order the axes by the first node at which they become non-zero
+        first_nonzero_node = nonzero.argmax(axis=0)
+        axis_nonzero_order = np.argsort(first_nonzero_node, kind="stable")
+
+        assert np.array_equal(axis_nonzero_order, np.arange(el.dimensions))
+
+
+def test_gmsh_node_tuples_are_lattice() -> None:
+    """Check that the gmsh node tuples are a permutation of the closed-form
+    lattice given by the lexicographic node tuples.
+    """
     from gmsh_interop.reader import _gmsh_supported_element_type_map
 
     for el in _gmsh_supported_element_type_map().values():
-        axis_nonzero_order = []
+        if el.node_count() != len(el.gmsh_node_tuples()):
+            # incomplete elements only have a subset of the lattice nodes
+            continue
+
+        assert sorted(el.gmsh_node_tuples()) == sorted(el.lexicographic_node_tuples())
+
+        gmsh_node_tuples = el.gmsh_node_tuples()
+        assert [
+            gmsh_node_tuples[i] for i in el.get_lexicographic_gmsh_node_indices()
+            ] == list(el.lexicographic_node_tuples())
+
+
+def test_element_info_shared_between_instances() -> None:
+    from gmsh_interop.reader import (
+        GmshIncompleteTriangularElement,
+        GmshTriangularElement,
+    )
 
-        for node in el.lexicographic_node_tuples():
-            nonzero_axes = {i for i, ni in enumerate(node) if ni}
-            for nzax in sorted(nonzero_axes):
-                if nzax not in axis_nonzero_order:
-                    axis_nonzero_order.append(nzax)
+    el_a = GmshTriangularElement(3)
+    el_b = GmshTriangularElement(3)
+    assert (el_a.get_lexicographic_gmsh_node_indices()
+            is el_b.get_lexicographic_gmsh_node_indices())
 
-        assert axis_nonzero_order == list(range(el.dimensions))
+    # the cache is keyed by the element class as well as the order
+    el_c = GmshIncompleteTriangularElement(3)
+    assert len(el_c.gmsh_node_tuples()) != len(el_a.gmsh_node_tuples())
 
 
 if __name__ == "__main__":